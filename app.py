@@ -9,17 +9,53 @@ os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import shutil
 import sys
+import tempfile
+import threading
+import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime, date
 import json
-import pandas as pd
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
 import io
+import re
+
+# orjson parses/serializes line-delimited JSON several times faster than the
+# stdlib; fall back to stdlib json when it is not installed
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _skip_copy_jsonl(path, entry_id):
+    """Stream-copy a JSONL file, dropping the line for entry_id.
+
+    Only lines containing the id are parsed to confirm the match; everything
+    else is copied as raw bytes, so deleting one row does not pay a JSON
+    parse + re-serialize round-trip for every other row.
+    """
+    needle = entry_id.encode()
+    # 256 KiB buffers amortize read/write syscalls over many small lines
+    with open(path, 'rb', buffering=1 << 18) as src, tempfile.NamedTemporaryFile(
+            'wb', delete=False, dir=path.parent, suffix='.tmp', buffering=1 << 18) as dst:
+        for line in src:
+            if needle in line:
+                try:
+                    if _json_loads(line).get('doc_id') == entry_id:
+                        continue
+                except ValueError:
+                    pass
+            dst.write(line)
+    os.replace(dst.name, path)
 
 # Add current directory to Python path
 sys.path.append(str(Path(__file__).parent))
@@ -45,310 +81,13 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
-<style>
-    .main-header {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 10px;
-        margin-bottom: 2rem;
-        text-align: center;
-        color: white;
-    }
-    
-    .feature-card {
-        background: white;
-        padding: 2rem;
-        border-radius: 15px;
-        box-shadow: 0 6px 12px rgba(0, 0, 0, 0.15);
-        margin-bottom: 2rem;
-        border-left: 6px solid #667eea;
-        font-size: 1.1rem;
-        line-height: 1.6;
-    }
-    
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        text-align: center;
-        margin: 1rem 0;
-        font-size: 1.2rem;
-        height: 150px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        align-items: center;
-        box-sizing: border-box;
-    }
-    
-    .metric-card h3 {
-        margin: 0 0 0.8rem 0;
-        font-size: 1rem;
-        font-weight: 600;
-        line-height: 1.2;
-        height: 1.2rem;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-    }
-    
-    .metric-card h2 {
-        margin: 0;
-        font-size: 1.6rem;
-        font-weight: bold;
-        line-height: 1.2;
-        height: 1.9rem;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        word-wrap: break-word;
-        max-width: 100%;
-        overflow: hidden;
-        text-overflow: ellipsis;
-    }
-    
-    .metric-card h4 {
-        margin: 0 0 0.8rem 0;
-        font-size: 1rem;
-        font-weight: 600;
-        line-height: 1.2;
-        height: 1.2rem;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-    }
-    
-    .metric-card p {
-        margin: 0;
-        font-size: 1.6rem;
-        font-weight: bold;
-        line-height: 1.2;
-        height: 1.9rem;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        word-wrap: break-word;
-        max-width: 100%;
-        overflow: hidden;
-        text-overflow: ellipsis;
-    }
-    
-    .emotion-badge {
-        background: linear-gradient(45deg, #ff6b6b, #feca57);
-        color: white;
-        padding: 0.3rem 0.8rem;
-        border-radius: 20px;
-        margin: 0.2rem;
-        display: inline-block;
-        font-size: 0.8rem;
-    }
-    
-    .tag-badge {
-        background: linear-gradient(45deg, #48cae4, #023e8a);
-        color: white;
-        padding: 0.3rem 0.8rem;
-        border-radius: 20px;
-        margin: 0.2rem;
-        display: inline-block;
-        font-size: 0.8rem;
-    }
-    
-    .sidebar-button {
-        width: 100%;
-        margin: 0.5rem 0;
-        padding: 0.8rem;
-        border-radius: 8px;
-        border: none;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        font-weight: bold;
-        transition: all 0.3s ease;
-    }
-    
-    .sidebar-button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
-    }
-    
-    .success-message {
-        background: linear-gradient(45deg, #00b894, #00cec9);
-        color: white;
-        padding: 2rem;
-        border-radius: 15px;
-        margin: 2rem 0;
-        font-size: 1.2rem;
-        text-align: center;
-    }
-    
-    .search-result {
-        background: #f8f9fa;
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-        border-left: 6px solid #667eea;
-        font-size: 1.1rem;
-        line-height: 1.6;
-    }
-    
-    .summary-box {
-        background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin: 2rem 0;
-        border: 1px solid #e0e0e0;
-        font-size: 1.1rem;
-        line-height: 1.6;
-    }
-    
-    .entry-card {
-        background: white;
-        padding: 2rem;
-        border-radius: 15px;
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
-        margin: 1.5rem 0;
-        border-left: 6px solid #48cae4;
-    }
-    
-    .download-section {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 15px;
-        margin: 2rem 0;
-        text-align: center;
-    }
-    
-    .delete-warning {
-        background: linear-gradient(45deg, #ff6b6b, #ff8e8e);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-        text-align: center;
-        font-weight: bold;
-    }
-    
-    .delete-info {
-        background: linear-gradient(45deg, #ffa726, #ffb74d);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-        text-align: center;
-    }
-    
-    /* Custom hover effects for gradient cards */
-    .gradient-card {
-        transition: all 0.3s ease;
-        cursor: pointer;
-    }
-    
-    .gradient-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 12px 35px rgba(0, 0, 0, 0.2) !important;
-    }
-    
-    /* Enhanced file uploader styling */
-    [data-testid="stFileUploader"] {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        border: 2px dashed #e0e0e0;
-        transition: all 0.3s ease;
-    }
-    
-    [data-testid="stFileUploader"]:hover {
-        border-color: #667eea;
-        background: #f8f9ff;
-    }
-    
-    /* Enhanced text input styling */
-    .stTextInput > div > div > input {
-        border-radius: 10px;
-        border: 2px solid #e0e0e0;
-        padding: 0.8rem;
-        font-size: 1rem;
-        transition: all 0.3s ease;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #667eea;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-    }
-    
-    /* Enhanced textarea styling */
-    .stTextArea > div > div > textarea {
-        border-radius: 12px;
-        border: 2px solid #e0e0e0;
-        padding: 1rem;
-        font-size: 1.05rem;
-        line-height: 1.6;
-        transition: all 0.3s ease;
-    }
-    
-    .stTextArea > div > div > textarea:focus {
-        border-color: #667eea;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-    }
-    
-    /* Enhanced button styling */
-    .stButton > button {
-        border-radius: 12px;
-        padding: 0.8rem 2rem;
-        font-size: 1.1rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-        border: none;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-    }
-    
-    /* Enhanced Navigation Buttons */
-    .stSidebar .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        border-radius: 12px;
-        padding: 0.9rem 1.5rem;
-        font-size: 1rem;
-        font-weight: 600;
-        text-align: left;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 12px rgba(102, 126, 234, 0.25);
-        margin-bottom: 0.5rem;
-    }
-    
-    .stSidebar .stButton > button:hover {
-        background: linear-gradient(135deg, #764ba2 0%, #667eea 100%);
-        transform: translateX(5px) translateY(-2px);
-        box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-    }
-    
-    .stSidebar .stButton > button:active {
-        transform: translateX(3px) translateY(0px);
-    }
-    
-    /* Smooth animations */
-    @keyframes fadeIn {
-        from { opacity: 0; transform: translateY(20px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-    
-    .feature-card, .metric-card, .gradient-card {
-        animation: fadeIn 0.5s ease;
-    }
+# Custom CSS for better styling - kept in a static file and cached so each
+# rerun reuses the same string instead of re-parsing a ~300 line literal
+@st.cache_data(show_spinner=False)
+def _css() -> str:
+    return (Path(__file__).parent / "static" / "mindlens.css").read_text(encoding="utf-8")
 
-    /* 🔥 Hide Streamlit's default multipage navigation */
-    section[data-testid="stSidebarNav"] {display: none;}
-    div[data-testid="stSidebarNav"] {display: none;}
-```
-""", unsafe_allow_html=True)
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
 
 
 # Initialize session state
@@ -357,6 +96,15 @@ if 'app' not in st.session_state:
 if 'initialized' not in st.session_state:
     st.session_state.initialized = False
 
+@st.cache_resource(show_spinner=False)
+def _get_app() -> "MindLensApp":
+    """Process-wide MindLensApp singleton.
+
+    cache_resource shares the loaded models across every session/tab, so
+    only the first connection pays the weight of loading them from disk.
+    """
+    return MindLensApp()
+
 def initialize_app():
     """Initialize the MindLens app."""
     if not st.session_state.initialized:
@@ -364,22 +112,52 @@ def initialize_app():
             st.error("⚠️ Application not available due to initialization error.")
             st.info("Please restart the application to resolve this issue.")
             return
-            
+
         with st.spinner("Initializing MindLens..."):
             try:
-                st.session_state.app = MindLensApp()
+                st.session_state.app = _get_app()
                 st.session_state.initialized = True
                 st.success("MindLens initialized successfully!")
             except Exception as e:
                 st.error(f"Failed to initialize MindLens: {e}")
                 st.stop()
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_emergency_contacts(path: str, mtime: float) -> list:
+    """Parse the emergency contacts JSON; mtime keys the cache so edits invalidate it."""
+    try:
+        with open(path, 'r') as f:
+            contacts = json.load(f)
+        return contacts if isinstance(contacts, list) else []
+    except Exception as e:
+        print(f"❌ Error loading emergency contacts: {e}")
+        return []
+
+def load_emergency_contacts() -> list:
+    """Cached read of the emergency contacts file.
+
+    Streamlit reruns the script on every click, so reading and parsing the
+    JSON each time is wasted I/O - the cache is keyed on path+mtime and
+    refreshes automatically when the file changes.
+    """
+    from config import EMERGENCY_CONTACTS_JSON
+    path = str(EMERGENCY_CONTACTS_JSON)
+    mtime = os.path.getmtime(path) if os.path.exists(path) else 0.0
+    return _load_emergency_contacts(path, mtime)
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _cached_stats(app_id: int) -> dict:
+    """Memoize app.get_stats() so the sidebar doesn't re-probe models on every rerun.
+
+    app_id keys the cache to the current app instance; ttl keeps the display
+    fresh if a backend changes.
+    """
+    return st.session_state.app.get_stats()
+
 def prompt_for_emergency_contact():
     """Prompt user for emergency contact if none exist."""
-    from mental_health_service import mental_health_service
-    
     # Check if emergency contacts exist
-    if not mental_health_service.has_emergency_contacts():
+    if not load_emergency_contacts():
         st.markdown("""
         <div style="
             background: linear-gradient(135deg, #ff6b6b 0%, #ff8e8e 100%);
@@ -447,8 +225,7 @@ def main():
         
         # Only prompt if no emergency contact has been added yet
         if not st.session_state.emergency_contact_added:
-            from mental_health_service import mental_health_service
-            if not mental_health_service.has_emergency_contacts():
+            if not load_emergency_contacts():
                 prompt_for_emergency_contact()
                 return  # Don't show the rest of the app until emergency contact is added
     
@@ -474,156 +251,69 @@ def main():
         """, unsafe_allow_html=True)
         
         # Navigation buttons
-        if st.button("📝 Add New Entry", key="nav_add", use_container_width=True):
-            st.session_state.current_page = "Add Entry"
-        
-        if st.button("🔍 Search Entries", key="nav_search", use_container_width=True):
-            st.session_state.current_page = "Search Entries"
-        
-        if st.button("🤖 AI Summary", key="nav_summary", use_container_width=True):
-            st.session_state.current_page = "AI Summary"
-        
-        if st.button("📊 Statistics", key="nav_stats", use_container_width=True):
-            st.session_state.current_page = "Statistics"
-        
-        if st.button("📚 View All Entries", key="nav_entries", use_container_width=True):
-            st.session_state.current_page = "View Entries"
-        
-        if st.button("📄 Download PDF", key="nav_download", use_container_width=True):
-            st.session_state.current_page = "Download PDF"
-        
-        if st.button("🛡️ Mental Support", key="nav_mental", use_container_width=True):
-            st.session_state.current_page = "Mental Support"
-        
-        if st.button("❓ FAQ", key="nav_faq", use_container_width=True):
-            st.session_state.current_page = "FAQ"
-        
-        if st.button("ℹ️ About", key="nav_about", use_container_width=True):
-            st.session_state.current_page = "About"
-        
+        for label, page_key, _ in NAV_PAGES:
+            if st.button(label, key=f"nav_{page_key}", use_container_width=True):
+                st.session_state.current_page = page_key
+
         st.markdown("---")
         
-        # Quick Stats
-        st.markdown("### 📈 Quick Stats")
+        # Quick Stats - collapsed by default; with the cached stats lookup the
+        # closed panel costs a dict hit per rerun instead of a model sweep
         if st.session_state.initialized:
-            stats = st.session_state.app.get_stats()
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("🗄️ Vector Store", stats['vector_store'].title())
-            with col2:
-                st.metric("🤖 LLM Backend", stats['llm_backend'].title())
-            
-            # Model status
-            st.markdown("#### 🧠 Model Status")
-            models = stats['models_loaded']
-            for model, status in models.items():
-                icon = "✅" if status else "❌"
-                st.write(f"{icon} {model.replace('_', ' ').title()}")
+            with st.expander("📈 Quick Stats", expanded=False):
+                stats = _cached_stats(id(st.session_state.app))
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("🗄️ Vector Store", stats['vector_store'].title())
+                with col2:
+                    st.metric("🤖 LLM Backend", stats['llm_backend'].title())
+
+                # Model status
+                st.markdown("#### 🧠 Model Status")
+                models = stats['models_loaded']
+                for model, status in models.items():
+                    icon = "✅" if status else "❌"
+                    st.write(f"{icon} {model.replace('_', ' ').title()}")
     
     # Initialize current page if not set
     if 'current_page' not in st.session_state:
         st.session_state.current_page = "Add Entry"
     
     # Main content area
-    if st.session_state.current_page == "Add Entry":
-        add_entry_page()
-    elif st.session_state.current_page == "Search Entries":
-        search_entries_page()
-    elif st.session_state.current_page == "AI Summary":
-        ai_summary_page()
-    elif st.session_state.current_page == "Statistics":
-        statistics_page()
-    elif st.session_state.current_page == "View Entries":
-        view_entries_page()
-    elif st.session_state.current_page == "Download PDF":
-        download_pdf_page()
-    elif st.session_state.current_page == "Mental Support":
-        mental_support_page()
-    elif st.session_state.current_page == "FAQ":
-        faq_page()
-    elif st.session_state.current_page == "About":
-        about_page()
+    PAGE_RENDERERS.get(st.session_state.current_page, add_entry_page)()
 
-def add_entry_page():
-    """Page for adding new diary entries."""
-    
-    # Check if high risk was detected and show persistent redirect buttons
-    if st.session_state.get('high_risk_detected', False):
-        st.markdown("""
-        <div class="feature-card" style="background: #ffe6e6; border: 3px solid #ff4444; margin-bottom: 2rem;">
-            <h2 style="color: #ff4444; text-align: center;">🚨 URGENT: High Risk Detected</h2>
-            <p style="text-align: center; font-size: 1.2em;">We're here to help you. Please redirect to mental health support.</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Check if emergency contacts exist
-        import json
-        import os
-        emergency_contacts = []
-        contacts_file = st.session_state.app.config.EMERGENCY_CONTACTS_JSON
-        
-        if os.path.exists(contacts_file):
-            try:
-                with open(contacts_file, 'r') as f:
-                    emergency_contacts = json.load(f)
-            except Exception as e:
-                print(f"❌ Error loading emergency contacts: {e}")
-        
-        # Show warning if no contacts exist (but don't show form)
-        if not emergency_contacts:
-            st.warning("⚠️ No emergency contacts configured. WhatsApp alerts cannot be sent. Please go to Mental Support page to add contacts.")
-        
-        # Redirect buttons
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            if st.button("🏃 Go to Mental Support NOW", type="primary", use_container_width=True, key="persistent_redirect_btn"):
-                # Send WhatsApp alerts if enabled and contacts exist
-                if st.session_state.app.config.AUTO_ALERT_ENABLED and emergency_contacts:
-                    # Check if alerts have already been sent to prevent duplicates
-                    if not st.session_state.get('whatsapp_alerts_sent', False):
-                        try:
-                            alert_message = f"🚨 CRISIS ALERT: High suicide risk detected in MindLens diary entry. Please check on this person immediately."
-                            
-                            if hasattr(st.session_state.app.suicide_detector, 'send_whatsapp_alert'):
-                                # Use the send_whatsapp_alert method which handles deduplication
-                                success = st.session_state.app.suicide_detector.send_whatsapp_alert(
-                                    st.session_state.app.config.EMERGENCY_CONTACTS_JSON,
-                                    alert_message
-                                )
-                            else:
-                                from suicide_detector_fallback import SuicideDetectorFallback
-                                detector = SuicideDetectorFallback("", "")
-                                # Use the send_whatsapp_alert method which handles deduplication
-                                success = detector.send_whatsapp_alert(
-                                    st.session_state.app.config.EMERGENCY_CONTACTS_JSON,
-                                    alert_message
-                                )
-                            
-                            if success:
-                                # Set flag to prevent duplicate sending
-                                st.session_state.whatsapp_alerts_sent = True
-                                print("✅ WhatsApp alerts sent for persistent high-risk alert")
-                            else:
-                                print("❌ Failed to send WhatsApp alerts")
-                        except Exception as e:
-                            print(f"❌ Error sending alerts: {e}")
-                                
-                # Clear the high risk flag and redirect
-                print("🔄 Redirecting to Mental Support page...")
-                st.session_state.high_risk_detected = False
-                st.session_state.current_page = "Mental Support"
-                st.rerun()
-            
-            if st.button("⏸️ I'm Safe - Continue", use_container_width=True, key="persistent_cancel_btn"):
-                st.session_state.high_risk_detected = False
-                st.success("✅ Okay. Please reach out if you need support.")
-                st.rerun()
-        
-        st.markdown("---")
-    
-    # Modern hero section with gradient
-    st.markdown("""
+@st.cache_resource(show_spinner=False)
+def get_whisper_model(model_dir: str, device: str = "cpu", compute_type: str = "int8"):
+    """Load the faster-whisper model once per process and reuse it across reruns.
+
+    int8 quantization roughly halves memory use and is much faster than the
+    default FP32 compute on CPU.
+    """
+    from faster_whisper import WhisperModel
+    # Ensure model dir exists
+    Path(model_dir).mkdir(parents=True, exist_ok=True)
+    return WhisperModel(
+        model_size_or_path=model_dir,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=max(1, (os.cpu_count() or 1) // 2),
+        # Two CTranslate2 workers let concurrent sessions transcribe in
+        # parallel instead of serializing on one OpenMP pool
+        num_workers=2
+    )
+
+# Static HTML snippets for the Add Entry page, hoisted to module level so
+# each rerun ships the same interned string instead of rebuilding ~1.5 KB
+# literals per call.
+HIGH_RISK_BANNER_HTML = """
+    <div class="feature-card" style="background: #ffe6e6; border: 3px solid #ff4444; margin-bottom: 2rem;">
+        <h2 style="color: #ff4444; text-align: center;">🚨 URGENT: High Risk Detected</h2>
+        <p style="text-align: center; font-size: 1.2em;">We're here to help you. Please redirect to mental health support.</p>
+    </div>
+    """
+
+HERO_HTML = """
     <div style="
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         padding: 3rem 2rem;
@@ -639,10 +329,9 @@ def add_entry_page():
             Capture your thoughts, feelings, and moments. Let AI help you understand your emotional journey.
         </p>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Date selection in a beautiful card
-    st.markdown("""
+    """
+
+DATE_CARD_HTML = """
     <div style="
         background: white;
         padding: 1.5rem;
@@ -653,26 +342,9 @@ def add_entry_page():
     ">
         <h3 style="margin: 0 0 1rem 0; color: #333; font-size: 1.3rem;">📅 When did this happen?</h3>
     </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        entry_date = st.date_input(
-            "📅 Date",
-            value=date.today(),
-            help="Select the date for this memory",
-            label_visibility="collapsed"
-        )
-    
-    st.markdown("<br>", unsafe_allow_html=True)
-    
-    # If a transcription was just created, set the widget state BEFORE rendering the widget
-    if st.session_state.get("_fill_entry_text_once"):
-        st.session_state["entry_text"] = st.session_state.get("_entry_text_buffer", "")
-        st.session_state.pop("_fill_entry_text_once", None)
+    """
 
-    # Text input in a beautiful card
-    st.markdown("""
+THOUGHTS_CARD_HTML = """
     <div style="
         background: white;
         padding: 1.5rem;
@@ -684,21 +356,9 @@ def add_entry_page():
         <h3 style="margin: 0 0 1rem 0; color: #333; font-size: 1.3rem;">💭 Share Your Thoughts</h3>
         <p style="color: #666; margin: 0; font-size: 0.95rem;">Express yourself freely. What’s on your mind today?</p>
     </div>
-    """, unsafe_allow_html=True)
-    
-    entry_text = st.text_area(
-        "Your thoughts",
-        height=220,
-        placeholder="✨ Today I felt... \n\n🌟 What happened: \n\n💖 How I’m feeling: \n\n🎯 What I’m grateful for: ",
-        label_visibility="collapsed",
-        key="entry_text",
-        help="Write freely about your day, feelings, experiences, or anything you'd like to remember"
-    )
-    
-    st.markdown("<br>", unsafe_allow_html=True)
-    
-    # Multimedia Upload Section Header
-    st.markdown("""
+    """
+
+MEDIA_HEADER_HTML = """
     <div style="
         text-align: center;
         padding: 1.5rem 0;
@@ -716,14 +376,9 @@ def add_entry_page():
             margin: 0;
         ">Add audio, video, or images to capture the complete experience</p>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Two-column layout for Audio and Video
-    col_audio, col_video = st.columns(2, gap="large")
-    
-    with col_audio:
-        # Audio Transcription Card
-        st.markdown("""
+    """
+
+AUDIO_CARD_HTML = """
         <div style="
             background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
             padding: 1.8rem 1.5rem;
@@ -754,49 +409,9 @@ def add_entry_page():
                 ">Convert speech to text</p>
             </div>
         </div>
-        """, unsafe_allow_html=True)
-        
-        audio_file = st.file_uploader(
-            "Upload audio file",
-            type=["wav", "mp3", "m4a"],
-            accept_multiple_files=False,
-            label_visibility="collapsed",
-            help="Supported formats: WAV, MP3, M4A",
-            key="audio_uploader"
-        )
-    if audio_file is not None:
-        if st.button("📝 Transcribe Audio", use_container_width=True):
-            try:
-                from faster_whisper import WhisperModel
-                # Ensure model dir exists
-                Path(WHISPER_MODEL_DIR).mkdir(parents=True, exist_ok=True)
-                # Load local model
-                model = WhisperModel(model_size_or_path=str(WHISPER_MODEL_DIR), device="cpu")
-                # Save temp audio
-                tmp_audio_path = Path("data") / "tmp_audio_input"
-                tmp_audio_path.mkdir(parents=True, exist_ok=True)
-                audio_path = tmp_audio_path / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{audio_file.name}"
-                with open(audio_path, "wb") as f:
-                    f.write(audio_file.read())
-                segments, info = model.transcribe(str(audio_path), beam_size=5)
-                transcript = "".join([seg.text for seg in segments]).strip()
-                if transcript:
-                    # Save into a buffer and set a one-shot flag so we can write to the widget state before render
-                    st.session_state["_entry_text_buffer"] = transcript
-                    st.session_state["_fill_entry_text_once"] = True
-                    st.success("✅ Transcription complete. Inserted into text area.")
-                    st.rerun()
-                else:
-                    st.info("No speech detected.")
-            except Exception as e:
-                st.error(f"❌ Transcription failed: {e}")
+        """
 
-    # Keep local variable in sync (optional)
-    entry_text = st.session_state.get("entry_text", entry_text)
-    
-    with col_video:
-        # Video Upload Card
-        st.markdown("""
+VIDEO_CARD_HTML = """
         <div style="
             background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
             padding: 1.8rem 1.5rem;
@@ -827,7 +442,380 @@ def add_entry_page():
                 ">Transcribe or attach video</p>
             </div>
         </div>
-        """, unsafe_allow_html=True)
+        """
+
+IMAGE_CARD_HTML = """
+    <div style="
+        background: linear-gradient(135deg, #fa709a 0%, #fee140 100%);
+        padding: 2.5rem 2rem;
+        border-radius: 20px;
+        box-shadow: 0 8px 30px rgba(250, 112, 154, 0.4);
+        margin-bottom: 2rem;
+        text-align: center;
+    ">
+        <div style="font-size: 3rem; margin-bottom: 0.8rem;">🖼️</div>
+        <h3 style="
+            color: white;
+            margin: 0 0 0.5rem 0;
+            font-size: 1.8rem;
+            font-weight: 700;
+            text-shadow: 2px 2px 8px rgba(0,0,0,0.5), 0 0 15px rgba(0,0,0,0.3);
+        ">Add a Picture to Your Memory</h3>
+        <p style="
+            color: white;
+            margin: 0;
+            font-size: 1.1rem;
+            font-weight: 500;
+            text-shadow: 1px 1px 4px rgba(0,0,0,0.4), 0 0 10px rgba(0,0,0,0.2);
+        ">A picture is worth a thousand words - attach a photo to make this moment unforgettable</p>
+    </div>
+    """
+
+SUBMIT_BANNER_HTML = """
+    <div style="
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 2rem;
+        border-radius: 20px;
+        text-align: center;
+        margin-bottom: 1.5rem;
+        box-shadow: 0 10px 30px rgba(102, 126, 234, 0.4);
+    ">
+        <div style="font-size: 2.5rem; margin-bottom: 0.8rem;">✨</div>
+        <h3 style="
+            color: white;
+            margin: 0 0 0.5rem 0;
+            font-size: 1.6rem;
+            font-weight: 700;
+            text-shadow: 2px 2px 8px rgba(0,0,0,0.5), 0 0 15px rgba(0,0,0,0.3);
+        ">Ready to Preserve This Moment?</h3>
+        <p style="
+            color: white;
+            margin: 0;
+            font-size: 1.05rem;
+            font-weight: 500;
+            text-shadow: 1px 1px 4px rgba(0,0,0,0.4), 0 0 10px rgba(0,0,0,0.2);
+        ">Your memory will be analyzed with AI to understand emotions and insights</p>
+    </div>
+    """
+
+@st.cache_resource(show_spinner=False)
+def get_batched_whisper(model_dir: str):
+    """VAD-batched pipeline over the shared WhisperModel.
+
+    Splits audio on silence and batches the chunks through the encoder, which
+    is noticeably faster than sequential decoding for clips over a minute.
+    """
+    from faster_whisper import BatchedInferencePipeline
+    return BatchedInferencePipeline(model=get_whisper_model(model_dir))
+
+def _save_upload(uploaded_file, dest: Path) -> None:
+    """Stream an uploaded file to dest atomically.
+
+    Writes into a temp file in the same directory and renames it into place,
+    so a crash mid-write never leaves a half-written file under the final
+    name.
+    """
+    uploaded_file.seek(0)
+    tmp = tempfile.NamedTemporaryFile(dir=dest.parent, delete=False)
+    try:
+        with tmp:
+            shutil.copyfileobj(uploaded_file, tmp, 1024 * 1024)
+        os.replace(tmp.name, dest)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+@st.cache_data(show_spinner=False)
+def _thumb(path: str, mtime: float) -> bytes:
+    """512 px JPEG thumbnail bytes for a stored image, keyed by (path, mtime).
+
+    Result lists re-render on every rerun; shipping a cached ~50 KB thumbnail
+    beats re-reading and re-encoding the full-size file each time. cache_data
+    (not lru_cache) so the cache survives script reruns; mtime in the key
+    means a replaced file re-encodes without any explicit invalidation.
+    """
+    from PIL import Image
+
+    im = Image.open(path)
+    im.thumbnail((512, 512), Image.LANCZOS)
+    if im.mode not in ("RGB", "L"):
+        im = im.convert("RGB")
+    buf = io.BytesIO()
+    im.save(buf, "JPEG", quality=80)
+    return buf.getvalue()
+
+def _render_image(path_str: str):
+    """Show a stored image as a cached thumbnail, falling back to the original."""
+    try:
+        st.image(_thumb(path_str, os.path.getmtime(path_str)))
+    except Exception:
+        st.image(path_str)
+
+@st.cache_resource(show_spinner=False)
+def _prefetch_pool() -> ThreadPoolExecutor:
+    """Media-warming pool; cache_resource keeps it (and its idle threads)
+    alive across reruns instead of rebuilding it with the script module.
+    Sized for a handful of concurrent thumbnail decodes."""
+    return ThreadPoolExecutor(max_workers=8)
+
+def _warm_thumb(path_str: str):
+    try:
+        _thumb(path_str, os.path.getmtime(path_str))
+    except Exception:
+        pass
+
+def _prefetch_media(results):
+    """Kick off background thumbnail/existence warming for result media.
+
+    By the time the expanders render, the bytes are already hot in the
+    _thumb/_path_exists caches instead of being decoded inline. Each task
+    attaches the current script-run context to its worker thread so that
+    _thumb's st.cache_data lookup works off the main thread.
+    """
+    pool = _prefetch_pool()
+    ctx = get_script_run_ctx()
+
+    def _submit(fn, arg):
+        def task():
+            add_script_run_ctx(threading.current_thread(), ctx)
+            fn(arg)
+        pool.submit(task)
+
+    for r in results or []:
+        if r.get('image_path'):
+            _submit(_warm_thumb, str(r['image_path']))
+        if r.get('video_path'):
+            _submit(_path_exists, str(r['video_path']))
+
+@lru_cache(maxsize=2048)
+def _path_exists(path_str: str) -> bool:
+    """Memoized existence check for media paths in result loops.
+
+    Every rerun re-renders the result list, so without the memo each widget
+    interaction costs one stat() per row. Cleared when entries change.
+    """
+    return Path(path_str).exists()
+
+# Cap the long side of stored images; phone photos are routinely 12 MP and
+# dominate the data directory otherwise
+MAX_IMAGE_SIDE = 1600
+
+def _save_image_upload(uploaded_file, dest: Path) -> Path:
+    """Downscale and recompress an uploaded image before saving.
+
+    Thumbnails to MAX_IMAGE_SIDE px on the long side and re-encodes as
+    progressive JPEG (quality 85), which is typically 5-10x smaller than the
+    original phone photo. Falls back to a verbatim copy if Pillow cannot
+    decode the file. Returns the path actually written.
+    """
+    try:
+        from PIL import Image, ImageOps
+
+        uploaded_file.seek(0)
+        im = Image.open(uploaded_file)
+        # Apply the EXIF rotation before stripping metadata in re-encode
+        im = ImageOps.exif_transpose(im)
+        im.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE), Image.LANCZOS)
+        if im.mode not in ("RGB", "L"):
+            im = im.convert("RGB")
+        dest = dest.with_suffix(".jpg")
+        tmp = tempfile.NamedTemporaryFile(dir=dest.parent, delete=False)
+        try:
+            with tmp:
+                im.save(tmp, "JPEG", quality=85, optimize=True, progressive=True)
+            os.replace(tmp.name, dest)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+        return dest
+    except (ImportError, OSError):
+        _save_upload(uploaded_file, dest)
+        return dest
+
+def add_entry_page():
+    """Page for adding new diary entries."""
+    # While the high-risk banner is up, render only the banner - building the
+    # whole form underneath it is wasted work until the user acts on it
+    if st.session_state.get('high_risk_detected', False):
+        _high_risk_banner()
+        return
+    _entry_form()
+
+@st.fragment
+def _high_risk_banner():
+    """Persistent high-risk redirect banner.
+
+    Runs as a fragment so its buttons rerun only this block instead of the
+    whole entry form.
+    """
+    st.markdown(HIGH_RISK_BANNER_HTML, unsafe_allow_html=True)
+
+    # Locals avoid repeated SessionStateProxy attribute walks below
+    app = st.session_state.app
+    contacts_path = app.config.EMERGENCY_CONTACTS_JSON
+    auto_alert = app.config.AUTO_ALERT_ENABLED
+
+    # Check if emergency contacts exist (cached read)
+    emergency_contacts = load_emergency_contacts()
+        
+    # Show warning if no contacts exist (but don't show form)
+    if not emergency_contacts:
+        st.warning("⚠️ No emergency contacts configured. WhatsApp alerts cannot be sent. Please go to Mental Support page to add contacts.")
+        
+    # Redirect buttons
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("🏃 Go to Mental Support NOW", type="primary", use_container_width=True, key="persistent_redirect_btn"):
+            # Check the session idempotency flag first: a re-click then skips
+            # the config probe, contacts check, and detector construction
+            if (not st.session_state.get('whatsapp_alerts_sent', False)
+                    and auto_alert
+                    and emergency_contacts):
+                # Set the flag before sending so the alert is single-flight
+                # even if send_whatsapp_alert raises
+                st.session_state.whatsapp_alerts_sent = True
+                try:
+                    alert_message = f"🚨 CRISIS ALERT: High suicide risk detected in MindLens diary entry. Please check on this person immediately."
+
+                    if hasattr(app.suicide_detector, 'send_whatsapp_alert'):
+                        # Use the send_whatsapp_alert method which handles deduplication
+                        success = app.suicide_detector.send_whatsapp_alert(
+                            contacts_path,
+                            alert_message
+                        )
+                    else:
+                        from suicide_detector_fallback import SuicideDetectorFallback
+                        detector = SuicideDetectorFallback("", "")
+                        # Use the send_whatsapp_alert method which handles deduplication
+                        success = detector.send_whatsapp_alert(
+                            contacts_path,
+                            alert_message
+                        )
+
+                    if success:
+                        print("✅ WhatsApp alerts sent for persistent high-risk alert")
+                    else:
+                        print("❌ Failed to send WhatsApp alerts")
+                except Exception as e:
+                    print(f"❌ Error sending alerts: {e}")
+
+            # Clear the high risk flag and redirect
+            print("🔄 Redirecting to Mental Support page...")
+            st.session_state.high_risk_detected = False
+            st.session_state.current_page = "Mental Support"
+            st.rerun()
+            
+        if st.button("⏸️ I'm Safe - Continue", use_container_width=True, key="persistent_cancel_btn"):
+            st.session_state.high_risk_detected = False
+            st.success("✅ Okay. Please reach out if you need support.")
+            st.rerun()
+        
+    st.markdown("---")
+
+
+@st.fragment
+def _entry_form():
+    """Date, text, and media inputs plus the save flow for a new entry.
+
+    Wrapped in a fragment so widget interactions rerun only the form -
+    sidebar stats, CSS injection, and contact probes are skipped on every
+    keystroke.
+    """
+    # Modern hero section with gradient
+    st.markdown(HERO_HTML, unsafe_allow_html=True)
+    
+    # Date selection in a beautiful card
+    st.markdown(DATE_CARD_HTML, unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        entry_date = st.date_input(
+            "📅 Date",
+            value=date.today(),
+            help="Select the date for this memory",
+            label_visibility="collapsed"
+        )
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # If a transcription was just created, set the widget state BEFORE rendering the widget
+    if st.session_state.get("_fill_entry_text_once"):
+        st.session_state["entry_text"] = st.session_state.get("_entry_text_buffer", "")
+        st.session_state.pop("_fill_entry_text_once", None)
+
+    # Text input in a beautiful card
+    st.markdown(THOUGHTS_CARD_HTML, unsafe_allow_html=True)
+    
+    entry_text = st.text_area(
+        "Your thoughts",
+        height=220,
+        placeholder="✨ Today I felt... \n\n🌟 What happened: \n\n💖 How I’m feeling: \n\n🎯 What I’m grateful for: ",
+        label_visibility="collapsed",
+        key="entry_text",
+        help="Write freely about your day, feelings, experiences, or anything you'd like to remember"
+    )
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Multimedia Upload Section Header
+    st.markdown(MEDIA_HEADER_HTML, unsafe_allow_html=True)
+    
+    # Two-column layout for Audio and Video
+    col_audio, col_video = st.columns(2, gap="large")
+    
+    with col_audio:
+        # Audio Transcription Card
+        st.markdown(AUDIO_CARD_HTML, unsafe_allow_html=True)
+        
+        audio_file = st.file_uploader(
+            "Upload audio file",
+            type=["wav", "mp3", "m4a"],
+            accept_multiple_files=False,
+            label_visibility="collapsed",
+            help="Supported formats: WAV, MP3, M4A",
+            key="audio_uploader"
+        )
+    if audio_file is not None:
+        with st.expander("⚙️ Transcription settings"):
+            beam_size = st.slider(
+                "Beam size",
+                1, 5, 1,
+                help="1 (greedy) is fastest and fine for quick diary notes. Higher values are slower but can be more accurate.",
+                key="whisper_beam_size"
+            )
+        if st.button("📝 Transcribe Audio", use_container_width=True):
+            try:
+                # Load local model (cached across reruns and sessions)
+                model = get_whisper_model(str(WHISPER_MODEL_DIR))
+                # Decode straight from memory - no temp-file write+read round trip
+                audio_buf = io.BytesIO(audio_file.getvalue())
+                # Skip silence and drop cross-segment conditioning - diary audio
+                # is short monologue, so this only cuts encoder invocations
+                segments, info = model.transcribe(
+                    audio_buf,
+                    beam_size=beam_size,
+                    vad_filter=True,
+                    vad_parameters={"min_silence_duration_ms": 500},
+                    condition_on_previous_text=False
+                )
+                transcript = "".join(seg.text for seg in segments).strip()
+                if transcript:
+                    # Save into a buffer and set a one-shot flag so we can write to the widget state before render
+                    st.session_state["_entry_text_buffer"] = transcript
+                    st.session_state["_fill_entry_text_once"] = True
+                    st.success("✅ Transcription complete. Inserted into text area.")
+                    st.rerun()
+                else:
+                    st.info("No speech detected.")
+            except Exception as e:
+                st.error(f"❌ Transcription failed: {e}")
+
+    # Keep local variable in sync (optional)
+    entry_text = st.session_state.get("entry_text", entry_text)
+    
+    with col_video:
+        # Video Upload Card
+        st.markdown(VIDEO_CARD_HTML, unsafe_allow_html=True)
         
         video_file = st.file_uploader(
             "Upload video file",
@@ -848,70 +836,44 @@ def add_entry_page():
         )
         
         if transcribe_video:
+            with st.expander("⚙️ Transcription settings"):
+                video_language = st.selectbox(
+                    "Spoken language",
+                    options=["en", "hi", "ta", "auto"],
+                    help="Naming the language skips Whisper's detection pass. Pick 'auto' to detect it from the first 30 seconds.",
+                    key="video_language"
+                )
             # Show transcribe button
             if st.button("🎥 Transcribe Video to Text", use_container_width=True, key="transcribe_video_btn", type="primary"):
                 try:
-                    import subprocess
-                    from faster_whisper import WhisperModel
-                    
-                    # Create temp directories
-                    tmp_video_path = Path("data") / "tmp_video_input"
-                    tmp_video_path.mkdir(parents=True, exist_ok=True)
-                    
-                    # Save uploaded video
-                    video_filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{video_file.name}"
-                    video_path = tmp_video_path / video_filename
-                    
-                    with st.spinner("💾 Saving video file..."):
-                        with open(video_path, "wb") as f:
-                            f.write(video_file.read())
-                    
-                    # Extract audio from video using FFmpeg
-                    audio_filename = f"{video_filename.rsplit('.', 1)[0]}.wav"
-                    audio_path = tmp_video_path / audio_filename
-                    
+                    # Decode the audio track in-process with PyAV (bundled with
+                    # faster-whisper): no ffmpeg fork, no temp video/WAV files,
+                    # and no extra WAV encode/decode round trip
+                    from faster_whisper.audio import decode_audio
+
                     with st.spinner("🎥 Extracting audio from video..."):
-                        # FFmpeg command to extract audio
-                        ffmpeg_cmd = [
-                            "ffmpeg",
-                            "-i", str(video_path),
-                            "-vn",  # No video
-                            "-acodec", "pcm_s16le",  # Audio codec
-                            "-ar", "16000",  # Sample rate 16kHz (good for Whisper)
-                            "-ac", "1",  # Mono audio
-                            "-y",  # Overwrite output file
-                            str(audio_path)
-                        ]
-                        
-                        result = subprocess.run(
-                            ffmpeg_cmd,
-                            capture_output=True,
-                            text=True,
-                            timeout=300  # 5 minutes timeout
-                        )
-                        
-                        if result.returncode != 0:
-                            st.error(f"❌ FFmpeg error: {result.stderr}")
-                            raise Exception(f"FFmpeg failed with return code {result.returncode}")
-                        
+                        # Decode from the upload buffer itself - getvalue()
+                        # would clone the whole payload into a second bytes
+                        # object first
+                        video_file.seek(0)
+                        audio_array = decode_audio(video_file, sampling_rate=16000)
                         st.success("✅ Audio extracted successfully!")
-                    
+
                     # Transcribe the extracted audio
                     with st.spinner("🎤 Transcribing audio to text..."):
-                        # Ensure model dir exists
-                        Path(WHISPER_MODEL_DIR).mkdir(parents=True, exist_ok=True)
-                        # Load local Whisper model
-                        model = WhisperModel(model_size_or_path=str(WHISPER_MODEL_DIR), device="cpu")
-                        segments, info = model.transcribe(str(audio_path), beam_size=5)
-                        transcript = "".join([seg.text for seg in segments]).strip()
-                    
-                    # Clean up temporary files
-                    try:
-                        video_path.unlink()
-                        audio_path.unlink()
-                    except:
-                        pass
-                    
+                        # Batched pipeline over the cached model: VAD-splits the
+                        # clip and pushes chunks through the encoder in batches.
+                        # Greedy decoding and the language hint keep decoder
+                        # compute and the detection pass off the hot path.
+                        batched = get_batched_whisper(str(WHISPER_MODEL_DIR))
+                        segments, info = batched.transcribe(
+                            audio_array,
+                            batch_size=8,
+                            beam_size=1,
+                            language=None if video_language == "auto" else video_language
+                        )
+                        transcript = "".join(seg.text for seg in segments).strip()
+
                     if transcript:
                         # Save into a buffer and set a one-shot flag
                         st.session_state["_entry_text_buffer"] = transcript
@@ -921,26 +883,10 @@ def add_entry_page():
                         st.rerun()
                     else:
                         st.warning("⚠️ No speech detected in video.")
-                        
-                except subprocess.TimeoutExpired:
-                    st.error("❌ Transcription timed out. Please try a shorter video (max 5 minutes).")
-                except FileNotFoundError:
-                    st.error("❌ FFmpeg is not installed on your system.")
-                    st.markdown("""
-                    <div class="feature-card" style="background: #fff3cd; border-left: 6px solid #ffc107;">
-                        <h4>💡 How to install FFmpeg:</h4>
-                        <ol>
-                            <li><strong>Windows:</strong> Download from <a href="https://ffmpeg.org/download.html" target="_blank">ffmpeg.org</a> and add to PATH</li>
-                            <li><strong>Mac:</strong> Run <code>brew install ffmpeg</code></li>
-                            <li><strong>Linux:</strong> Run <code>sudo apt-get install ffmpeg</code></li>
-                        </ol>
-                        <p>After installation, restart the application.</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+
                 except Exception as e:
                     st.error(f"❌ Video transcription failed: {e}")
                     with st.expander("🔍 View error details"):
-                        import traceback
                         st.code(traceback.format_exc())
         else:
             # User doesn't want to transcribe - just inform them
@@ -949,32 +895,7 @@ def add_entry_page():
     st.markdown("<br>", unsafe_allow_html=True)
 
     # Image upload section - Enhanced full-width card
-    st.markdown("""
-    <div style="
-        background: linear-gradient(135deg, #fa709a 0%, #fee140 100%);
-        padding: 2.5rem 2rem;
-        border-radius: 20px;
-        box-shadow: 0 8px 30px rgba(250, 112, 154, 0.4);
-        margin-bottom: 2rem;
-        text-align: center;
-    ">
-        <div style="font-size: 3rem; margin-bottom: 0.8rem;">🖼️</div>
-        <h3 style="
-            color: white;
-            margin: 0 0 0.5rem 0;
-            font-size: 1.8rem;
-            font-weight: 700;
-            text-shadow: 2px 2px 8px rgba(0,0,0,0.5), 0 0 15px rgba(0,0,0,0.3);
-        ">Add a Picture to Your Memory</h3>
-        <p style="
-            color: white;
-            margin: 0;
-            font-size: 1.1rem;
-            font-weight: 500;
-            text-shadow: 1px 1px 4px rgba(0,0,0,0.4), 0 0 10px rgba(0,0,0,0.2);
-        ">A picture is worth a thousand words - attach a photo to make this moment unforgettable</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(IMAGE_CARD_HTML, unsafe_allow_html=True)
     
     col_img1, col_img2 = st.columns([1, 1], gap="medium")
     
@@ -998,32 +919,7 @@ def add_entry_page():
     st.markdown("<br><br>", unsafe_allow_html=True)
     
     # Submit button section with enhanced styling
-    st.markdown("""
-    <div style="
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 20px;
-        text-align: center;
-        margin-bottom: 1.5rem;
-        box-shadow: 0 10px 30px rgba(102, 126, 234, 0.4);
-    ">
-        <div style="font-size: 2.5rem; margin-bottom: 0.8rem;">✨</div>
-        <h3 style="
-            color: white;
-            margin: 0 0 0.5rem 0;
-            font-size: 1.6rem;
-            font-weight: 700;
-            text-shadow: 2px 2px 8px rgba(0,0,0,0.5), 0 0 15px rgba(0,0,0,0.3);
-        ">Ready to Preserve This Moment?</h3>
-        <p style="
-            color: white;
-            margin: 0;
-            font-size: 1.05rem;
-            font-weight: 500;
-            text-shadow: 1px 1px 4px rgba(0,0,0,0.4), 0 0 10px rgba(0,0,0,0.2);
-        ">Your memory will be analyzed with AI to understand emotions and insights</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(SUBMIT_BANNER_HTML, unsafe_allow_html=True)
     
     # Submit button - larger and more prominent
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -1032,21 +928,22 @@ def add_entry_page():
             if entry_text.strip():
                 with st.spinner("🤖 Processing your entry..."):
                     try:
+                        # One timestamp per submit so the image and video of
+                        # the same entry share a filename prefix
+                        ts = datetime.now().strftime('%Y%m%d_%H%M%S')
                         saved_image_path = None
                         if img_file is not None:
                             IMAGES_DIR.mkdir(parents=True, exist_ok=True)
-                            img_save = IMAGES_DIR / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{img_file.name}"
-                            with open(img_save, "wb") as f:
-                                f.write(img_file.read())
+                            img_save = IMAGES_DIR / f"{ts}_{img_file.name}"
+                            img_save = _save_image_upload(img_file, img_save)
                             saved_image_path = str(img_save.relative_to(Path.cwd()))
 
                         # Save video file if uploaded
                         saved_video_path = None
                         if video_file is not None:
                             VIDEOS_DIR.mkdir(parents=True, exist_ok=True)
-                            video_save = VIDEOS_DIR / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{video_file.name}"
-                            with open(video_save, "wb") as f:
-                                f.write(video_file.getvalue())  # getvalue() to read uploaded file
+                            video_save = VIDEOS_DIR / f"{ts}_{video_file.name}"
+                            _save_upload(video_file, video_save)
                             saved_video_path = str(video_save.relative_to(Path.cwd()))
 
                         result = st.session_state.app.process_entry(
@@ -1056,6 +953,8 @@ def add_entry_page():
                             image_desc=image_desc.strip() if image_desc else None,
                             video_path=saved_video_path
                         )
+                        # Cached summaries go stale once a new entry exists
+                        _summary_and_related.clear()
                         
                         st.markdown("""
                         <div class="success-message">
@@ -1064,73 +963,62 @@ def add_entry_page():
                         </div>
                         """, unsafe_allow_html=True)
                         
-                        # Display results in cards
-                        col1, col2, col3, col4 = st.columns(4)
-                        with col1:
-                            st.markdown(f"""
+                        # Display results in cards - a single CSS grid blob
+                        # instead of st.columns(4) with four markdown calls,
+                        # so Streamlit diffs one element rather than a
+                        # four-column component tree
+                        suicide_score = result.get('suicide_score')
+                        if suicide_score is not None:
+                            if suicide_score >= 0.5:
+                                risk_level = "High Risk"
+                                risk_color = "#ff6b6b"
+                                icon = "🔴"
+                            else:
+                                risk_level = "Low Risk"
+                                risk_color = "#4caf50"
+                                icon = "🟢"
+                            risk_card = f"""
+                            <div class="metric-card" style="border-left: 6px solid {risk_color};">
+                                <h3>🛡️ Mental Health</h3>
+                                <h2 style="color: {risk_color};">{icon} {risk_level}</h2>
+                                <p style="font-size: 0.8em; margin: 0;">Score: {suicide_score:.2f}</p>
+                            </div>
+                            """
+                        else:
+                            risk_card = """
+                            <div class="metric-card">
+                                <h3>🛡️ Mental Health</h3>
+                                <h2>N/A</h2>
+                            </div>
+                            """
+
+                        st.markdown(f"""
+                        <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">
                             <div class="metric-card">
                                 <h3>😊 Sentiment</h3>
                                 <h2>{result['sentiment'].title()}</h2>
                             </div>
-                            """, unsafe_allow_html=True)
-                        
-                        with col2:
-                            st.markdown(f"""
                             <div class="metric-card">
                                 <h3>🎭 Emotions</h3>
                                 <h2>{len(result['emotions'])}</h2>
                             </div>
-                            """, unsafe_allow_html=True)
-                        
-                        with col3:
-                            st.markdown(f"""
                             <div class="metric-card">
                                 <h3>🏷️ Tags</h3>
                                 <h2>{len(result['tags'])}</h2>
                             </div>
-                            """, unsafe_allow_html=True)
-                        
-                        with col4:
-                            # Suicide risk assessment
-                            suicide_score = result.get('suicide_score')
-                            if suicide_score is not None:
-                                if suicide_score >= 0.5:
-                                    risk_level = "High Risk"
-                                    risk_color = "#ff6b6b"
-                                    icon = "🔴"
-                                else:
-                                    risk_level = "Low Risk"
-                                    risk_color = "#4caf50"
-                                    icon = "🟢"
-                                
-                                st.markdown(f"""
-                                <div class="metric-card" style="border-left: 6px solid {risk_color};">
-                                    <h3>🛡️ Mental Health</h3>
-                                    <h2 style="color: {risk_color};">{icon} {risk_level}</h2>
-                                    <p style="font-size: 0.8em; margin: 0;">Score: {suicide_score:.2f}</p>
-                                </div>
-                                """, unsafe_allow_html=True)
-                            else:
-                                st.markdown(f"""
-                                <div class="metric-card">
-                                    <h3>🛡️ Mental Health</h3>
-                                    <h2>N/A</h2>
-                                </div>
-                                """, unsafe_allow_html=True)
+                            {risk_card}
+                        </div>
+                        """, unsafe_allow_html=True)
                         
                         # Show detected emotions and tags
                         if result['emotions']:
                             st.markdown("### 🎭 Detected Emotions")
-                            emotion_html = ""
-                            for emotion in result['emotions']:
-                                emotion_html += f'<span class="emotion-badge">{emotion}</span>'
+                            emotion_html = "".join(f'<span class="emotion-badge">{emotion}</span>' for emotion in result['emotions'])
                             st.markdown(emotion_html, unsafe_allow_html=True)
-                        
+
                         if result['tags']:
                             st.markdown("### 🏷️ Context Tags")
-                            tag_html = ""
-                            for tag in result['tags']:
-                                tag_html += f'<span class="tag-badge">{tag}</span>'
+                            tag_html = "".join(f'<span class="tag-badge">{tag}</span>' for tag in result['tags'])
                             st.markdown(tag_html, unsafe_allow_html=True)
                         
                         # Show suicide risk analysis if available
@@ -1175,10 +1063,12 @@ def add_entry_page():
                             
                             with col2:
                                 if suicide_tags:
-                                    tag_html = ""
-                                    for tag in suicide_tags[:5]:  # Show first 5 tags
-                                        tag_html += f'<span class="tag" style="background: {card_color}20; color: {card_color}; border: 1px solid {card_color}; padding: 0.2rem 0.5rem; border-radius: 15px; margin: 0.2rem; display: inline-block; font-size: 0.8em;">{tag.replace("_", " ").title()}</span>'
-                                    
+                                    # Show first 5 tags
+                                    tag_html = "".join(
+                                        f'<span class="tag" style="background: {card_color}20; color: {card_color}; border: 1px solid {card_color}; padding: 0.2rem 0.5rem; border-radius: 15px; margin: 0.2rem; display: inline-block; font-size: 0.8em;">{tag.replace("_", " ").title()}</span>'
+                                        for tag in suicide_tags[:5]
+                                    )
+
                                     st.markdown(f"""
                                     <div class="metric-card">
                                         <h4>🏷️ Key Indicators</h4>
@@ -1288,7 +1178,7 @@ def add_entry_page():
                         if result.get('image_path'):
                             st.markdown("### 🖼️ Image Attached")
                             try:
-                                st.image(str(result['image_path']))
+                                _render_image(str(result['image_path']))
                                 if result.get('image_desc'):
                                     st.caption(f"Description: {result['image_desc']}")
                             except Exception:
@@ -1350,23 +1240,18 @@ def search_entries_page():
             if image_desc_query.strip():
                 with st.spinner("🖼️ Retrieving images by description…"):
                     try:
+                        # Filtering happens inside the vector store, so top_k
+                        # results come back already restricted to image
+                        # entries matching the description
                         img_results = st.session_state.app.search_entries(
                             query=image_desc_query,
                             top_k=top_k,
                             filter_emotions=filter_emotions if filter_emotions else None,
-                            filter_tags=filter_tags if filter_tags else None
+                            filter_tags=filter_tags if filter_tags else None,
+                            require_image=True,
+                            document_contains=image_desc_query
                         )
-                        # Keep only entries that have images and strongly prefer description match
-                        desc_lower = image_desc_query.lower()
-                        filtered = []
-                        for r in img_results:
-                            if not r.get('image_path'):
-                                continue
-                            img_desc = (r.get('image_desc') or '').lower()
-                            txt = (r.get('text') or '').lower()
-                            if desc_lower and (desc_lower in img_desc or desc_lower in txt):
-                                filtered.append(r)
-                        img_results = filtered
+                        _prefetch_media(img_results)
                         if img_results:
                             st.markdown(f"""
                             <div class="success-message">
@@ -1374,10 +1259,10 @@ def search_entries_page():
                             </div>
                             """, unsafe_allow_html=True)
                             for i, result in enumerate(img_results, 1):
-                                with st.expander(f"🖼️ Image Entry {i} - {result.get('date')}", expanded=True):
+                                with st.expander(f"🖼️ Image Entry {i} - {result.get('date')}", expanded=False):
                                     if result.get('image_path'):
                                         try:
-                                            st.image(str(result.get('image_path')))
+                                            _render_image(str(result.get('image_path')))
                                         except Exception:
                                             st.info("Image associated but could not be previewed.")
                                     if result.get('image_desc'):
@@ -1388,7 +1273,7 @@ def search_entries_page():
                                         st.markdown("### 🎥 Video")
                                         try:
                                             video_path = Path(result.get('video_path'))
-                                            if video_path.exists():
+                                            if _path_exists(str(video_path)):
                                                 st.video(str(video_path))
                                             else:
                                                 st.warning(f"⚠️ Video file not found: {result.get('video_path')}")
@@ -1412,111 +1297,130 @@ def search_entries_page():
             if search_query.strip():
                 with st.spinner("🔍 Searching your memories..."):
                     try:
-                        results = st.session_state.app.search_entries(
+                        st.session_state.search_results = st.session_state.app.search_entries(
                             query=search_query,
                             top_k=top_k,
                             filter_emotions=filter_emotions if filter_emotions else None,
                             filter_tags=filter_tags if filter_tags else None
                         )
-                        
-                        if results:
-                            st.markdown(f"""
-                            <div class="success-message">
-                                <h3>🎯 Found {len(results)} matching entries!</h3>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            for i, result in enumerate(results, 1):
-                                with st.expander(f"📝 Entry {i} - {result.get('date')}", expanded=True):
-                                    st.markdown(f"""
-                                    <div class="search-result">
-                                        <p><strong>Text:</strong> {result.get('text')}</p>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                    
-                                    # Show metadata in cards
-                                    col1, col2, col3 = st.columns(3)
-                                    with col1:
-                                        st.markdown(f"""
-                                        <div class="metric-card">
-                                            <h3>😊 Sentiment</h3>
-                                            <h2>{result.get('sentiment').title()}</h2>
-                                        </div>
-                                        """, unsafe_allow_html=True)
-                                    
-                                    with col2:
-                                        emotions = result.get('emotions', [])
-                                        emotion_text = ', '.join(emotions) if emotions else 'None'
-                                        st.markdown(f"""
-                                        <div class="metric-card">
-                                            <h3>🎭 Emotions</h3>
-                                            <h2>{emotion_text}</h2>
-                                        </div>
-                                        """, unsafe_allow_html=True)
-                                    
-                                    with col3:
-                                        tags = result.get('tags', [])
-                                        tag_text = ', '.join(tags) if tags else 'None'
-                                        st.markdown(f"""
-                                        <div class="metric-card">
-                                            <h3>🏷️ Tags</h3>
-                                            <h2>{tag_text}</h2>
-                                        </div>
-                                        """, unsafe_allow_html=True)
-                                    
-                                    # Show image preview if available
-                                    if result.get('image_path'):
-                                        st.markdown("### 🖼️ Image")
-                                        try:
-                                            st.image(str(result.get('image_path')))
-                                            if result.get('image_desc'):
-                                                st.caption(f"Description: {result.get('image_desc')}")
-                                        except Exception:
-                                            st.info("Image associated but could not be previewed.")
-                                    
-                                    # Show video if available
-                                    if result.get('video_path'):
-                                        st.markdown("### 🎥 Video")
-                                        try:
-                                            video_path = Path(result.get('video_path'))
-                                            if video_path.exists():
-                                                st.video(str(video_path))
-                                            else:
-                                                st.warning(f"⚠️ Video file not found: {result.get('video_path')}")
-                                        except Exception as e:
-                                            st.info(f"Video associated but could not be previewed: {e}")
-
-                                    # Show suicide risk if available
-                                    if result.get('suicide_score') is not None:
-                                        suicide_score = result.get('suicide_score', 0.0)
-                                        suicide_prediction = result.get('suicide_prediction', 'Unknown')
-                                        if suicide_score >= 0.5:
-                                            risk_color = "#ff6b6b"
-                                            risk_level = "High Risk"
-                                        else:
-                                            risk_color = "#4caf50"
-                                            risk_level = "Low Risk"
-                                        
-                                        st.markdown(f"""
-                                        <div class="metric-card" style="border-left: 6px solid {risk_color}; margin: 1rem 0;">
-                                            <h3>🛡️ Mental Health Risk</h3>
-                                            <h2 style="color: {risk_color};">{risk_level}</h2>
-                                            <p style="font-size: 0.8em; margin: 0;">Score: {suicide_score:.2f}</p>
-                                        </div>
-                                        """, unsafe_allow_html=True)
-                                    
-                                    # Show similarity score if available
-                                    if 'distance' in result:
-                                        similarity = 1 - result['distance']  # Convert distance to similarity
-                                        st.metric("🎯 Similarity Score", f"{similarity:.2f}")
-                        else:
-                            st.info("🔍 No matching entries found. Try a different search query or adjust filters.")
-                            
+                        st.session_state.search_page = 1
+                        _prefetch_media(st.session_state.search_results)
                     except Exception as e:
+                        st.session_state.search_results = None
                         st.error(f"❌ Error searching entries: {e}")
             else:
                 st.warning("⚠️ Please enter a search query.")
 
+    # Results render outside the button block so pagination clicks and other
+    # widget interactions do not throw them away
+    results = st.session_state.get('search_results')
+    if results is not None:
+        if results:
+            st.markdown(f"""
+            <div class="success-message">
+                <h3>🎯 Found {len(results)} matching entries!</h3>
+            </div>
+            """, unsafe_allow_html=True)
+
+            # Collapsed expanders defer media fetch/decode until opened; load
+            # five at a time so top_k=20 does not render 20 blocks up front
+            page_size = 5
+            shown = results[:page_size * st.session_state.get('search_page', 1)]
+            for i, result in enumerate(shown, 1):
+                with st.expander(f"📝 Entry {i} - {result.get('date')}", expanded=False):
+                    st.markdown(f"""
+                    <div class="search-result">
+                        <p><strong>Text:</strong> {result.get('text')}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                    # Show metadata in cards - one markdown blob per result
+                    # instead of st.columns(3) with three separate calls
+                    emotions = result.get('emotions', [])
+                    emotion_text = ', '.join(emotions) if emotions else 'None'
+                    tags = result.get('tags', [])
+                    tag_text = ', '.join(tags) if tags else 'None'
+                    st.markdown(f"""
+                    <div style="display: flex; gap: 1rem;">
+                        <div class="metric-card" style="flex: 1;">
+                            <h3>😊 Sentiment</h3>
+                            <h2>{result.get('sentiment').title()}</h2>
+                        </div>
+                        <div class="metric-card" style="flex: 1;">
+                            <h3>🎭 Emotions</h3>
+                            <h2>{emotion_text}</h2>
+                        </div>
+                        <div class="metric-card" style="flex: 1;">
+                            <h3>🏷️ Tags</h3>
+                            <h2>{tag_text}</h2>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                    # Show image preview if available
+                    if result.get('image_path'):
+                        st.markdown("### 🖼️ Image")
+                        try:
+                            _render_image(str(result.get('image_path')))
+                            if result.get('image_desc'):
+                                st.caption(f"Description: {result.get('image_desc')}")
+                        except Exception:
+                            st.info("Image associated but could not be previewed.")
+
+                    # Show video if available
+                    if result.get('video_path'):
+                        st.markdown("### 🎥 Video")
+                        try:
+                            video_path = Path(result.get('video_path'))
+                            if _path_exists(str(video_path)):
+                                st.video(str(video_path))
+                            else:
+                                st.warning(f"⚠️ Video file not found: {result.get('video_path')}")
+                        except Exception as e:
+                            st.info(f"Video associated but could not be previewed: {e}")
+
+                    # Show suicide risk if available
+                    if result.get('suicide_score') is not None:
+                        suicide_score = result.get('suicide_score', 0.0)
+                        suicide_prediction = result.get('suicide_prediction', 'Unknown')
+                        if suicide_score >= 0.5:
+                            risk_color = "#ff6b6b"
+                            risk_level = "High Risk"
+                        else:
+                            risk_color = "#4caf50"
+                            risk_level = "Low Risk"
+
+                        st.markdown(f"""
+                        <div class="metric-card" style="border-left: 6px solid {risk_color}; margin: 1rem 0;">
+                            <h3>🛡️ Mental Health Risk</h3>
+                            <h2 style="color: {risk_color};">{risk_level}</h2>
+                            <p style="font-size: 0.8em; margin: 0;">Score: {suicide_score:.2f}</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+
+                    # Show similarity score if available
+                    if 'distance' in result:
+                        similarity = 1 - result['distance']  # Convert distance to similarity
+                        st.metric("🎯 Similarity Score", f"{similarity:.2f}")
+
+            if len(shown) < len(results):
+                if st.button(f"⬇️ Load more ({len(results) - len(shown)} remaining)", use_container_width=True):
+                    st.session_state.search_page = st.session_state.get('search_page', 1) + 1
+                    st.rerun()
+        else:
+            st.info("🔍 No matching entries found. Try a different search query or adjust filters.")
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _summary_and_related(query: str, top_k: int):
+    """AI summary plus its related entries under one cache key.
+
+    Repeat clicks with the same query and top_k skip the LLM round-trip and
+    the retrieval entirely.
+    """
+    # return_context exposes the hits the summary was built from, so the
+    # related-entries list costs no second search
+    return st.session_state.app.get_ai_summary(query, top_k=top_k, return_context=True)
+
 def ai_summary_page():
     """Page for AI-powered summaries."""
     st.markdown("""
@@ -1545,11 +1449,10 @@ def ai_summary_page():
             if summary_query.strip():
                 with st.spinner("🤖 Analyzing your thoughts with AI..."):
                     try:
-                        summary = st.session_state.app.get_ai_summary(
-                            query=summary_query,
-                            top_k=top_k
-                        )
-                        
+                        summary, related = _summary_and_related(summary_query, top_k)
+                        _prefetch_media(related)
+
+
                         st.markdown("""
                         <div class="success-message">
                             <h3>🎉 AI Summary Generated!</h3>
@@ -1565,10 +1468,6 @@ def ai_summary_page():
                         
                         # Show related entries (text + image) for the same query
                         try:
-                            related = st.session_state.app.search_entries(
-                                query=summary_query,
-                                top_k=top_k
-                            )
                             if related:
                                 st.markdown("### 🔗 Related Entries")
                                 for i, result in enumerate(related, 1):
@@ -1581,7 +1480,7 @@ def ai_summary_page():
                                         if result.get('image_path'):
                                             st.markdown("#### 🖼️ Image")
                                             try:
-                                                st.image(str(result.get('image_path')))
+                                                _render_image(str(result.get('image_path')))
                                                 if result.get('image_desc'):
                                                     st.caption(f"Description: {result.get('image_desc')}")
                                             except Exception:
@@ -1597,6 +1496,608 @@ def ai_summary_page():
             else:
                 st.warning("⚠️ Please enter a query for the summary.")
 
+# Keyword-extraction constants, hoisted so every dashboard build reuses the
+# compiled pattern and the same set object
+_WORD_RE = re.compile(r'\b[a-z]+\b')
+_STOPWORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'is', 'was', 'are', 'were', 'been', 'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'my', 'your', 'his', 'her', 'its', 'our', 'their', 'this', 'that', 'these', 'those'})
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _build_dashboard(mtime: float):
+    """Compute analytics KPIs and pre-build every dashboard figure.
+
+    Keyed on the entries file's mtime, so reruns with unchanged data skip the
+    pandas and plotly work entirely and just re-render cached figures.
+    Returns None when there are no entries yet.
+    """
+    import numpy as np
+    import pandas as pd
+    import plotly.graph_objects as go
+
+    # pandas parses the JSONL in C - much faster than a json.loads-per-line
+    # loop, and skips the intermediate list of dicts
+    df = pd.read_json("data/entries.jsonl", lines=True)
+    if df.empty:
+        return None
+
+    df['date'] = pd.to_datetime(df['date'])
+
+    # Derived columns are persisted at write time (see storage.DiaryRecord);
+    # compute them only for legacy rows that predate that
+    if 'text_length' in df.columns:
+        df['text_length'] = df['text_length'].fillna(df['text'].str.len())
+    else:
+        df['text_length'] = df['text'].str.len()
+
+    if 'word_count' in df.columns:
+        # Single regex pass; str.split().str.len() materializes a list per row
+        df['word_count'] = df['word_count'].fillna(df['text'].str.count(r'\s+') + 1)
+    else:
+        df['word_count'] = df['text'].str.count(r'\s+') + 1
+
+    # Hour the entry was written, defaulting legacy rows to noon
+    if 'hour' in df.columns:
+        df['hour'] = df['hour'].fillna(12)
+    elif 'timestamp' in df.columns:
+        df['hour'] = pd.to_datetime(df['timestamp']).dt.hour
+    else:
+        df['hour'] = 12
+
+    # Ordered categorical: groupby hashes the 7 integer codes instead of one
+    # string per row, and grouped output comes back already in weekday order
+    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    df['day_of_week'] = pd.Categorical(df['date'].dt.day_name(), categories=day_order, ordered=True)
+
+    # Sentiment score (1=positive, 0=neutral, -1=negative); legacy rows map
+    # through categorical codes - one C pass, no per-row dict lookup
+    if 'sentiment_score' not in df.columns or df['sentiment_score'].isna().any():
+        codes = pd.Categorical(df['sentiment'], categories=['negative', 'neutral', 'positive']).codes
+        computed = pd.Series(np.where(codes >= 0, codes - 1, 0), index=df.index)
+        if 'sentiment_score' in df.columns:
+            df['sentiment_score'] = df['sentiment_score'].fillna(computed)
+        else:
+            df['sentiment_score'] = computed
+
+    dashboard = {}
+
+    # One per-date aggregation pass; the KPI windows and both trend charts
+    # are derived from it instead of re-scanning the frame
+    df['suicide_flagged'] = df['suicide_score'] >= 0.5 if 'suicide_score' in df.columns else False
+    daily_agg = df.groupby('date').agg(
+        sent_sum=('sentiment_score', 'sum'),
+        n=('sentiment_score', 'size'),
+        risk=('suicide_flagged', 'sum'),
+    )
+
+    # === KPIs ===
+    now = pd.Timestamp.now()
+    last_30_days = df[df['date'] >= (now - pd.Timedelta(days=30))]
+
+    win7 = daily_agg[daily_agg.index >= (now - pd.Timedelta(days=7))]
+    n_7d = int(win7['n'].sum())
+    avg_sentiment_7d = (win7['sent_sum'].sum() / n_7d) if n_7d > 0 else 0
+
+    win30 = daily_agg[daily_agg.index >= (now - pd.Timedelta(days=30))]
+    n_30d = int(win30['n'].sum())
+    risk_count = int(win30['risk'].sum())
+    suicide_pct_30d = (risk_count / n_30d * 100) if n_30d > 0 else 0
+
+    # Streaks: one run-length encoding over the date-sorted sign sequence
+    # gives the longest positive streak and both current streaks in a single
+    # O(N) pass (the old per-score Python loops broke after one iteration and
+    # never measured a real streak)
+    signs = np.sign(df.sort_values('date')['sentiment_score'].to_numpy())
+    if len(signs):
+        boundaries = np.flatnonzero(np.diff(signs)) + 1
+        runs = np.diff(np.r_[0, boundaries, len(signs)])
+        run_signs = signs[np.r_[0, boundaries]]
+        pos_runs = runs[run_signs > 0]
+        max_positive_streak = int(pos_runs.max()) if len(pos_runs) else 0
+        positive_streak_current = int(runs[-1]) if run_signs[-1] > 0 else 0
+        negative_streak_current = int(runs[-1]) if run_signs[-1] < 0 else 0
+    else:
+        max_positive_streak = 0
+        positive_streak_current = 0
+        negative_streak_current = 0
+
+    # Most frequent emotion and context - one Counter pass, no intermediate
+    # list or Series histogram
+    emotion_counter = Counter(chain.from_iterable(x for x in last_30_days['emotions'] if x))
+    most_freq_emotion = emotion_counter.most_common(1)[0][0] if emotion_counter else 'N/A'
+
+    tag_counter = Counter(chain.from_iterable(x for x in last_30_days['tags'] if x))
+    most_freq_context = tag_counter.most_common(1)[0][0] if tag_counter else 'N/A'
+
+    dashboard.update(
+        avg_sentiment_7d=avg_sentiment_7d,
+        n_7d=n_7d,
+        n_30d=n_30d,
+        risk_count=risk_count,
+        suicide_pct_30d=suicide_pct_30d,
+        max_positive_streak=max_positive_streak,
+        most_freq_emotion=most_freq_emotion,
+        most_freq_context=most_freq_context,
+    )
+
+    # === Trends Over Time ===
+    daily_sentiment = (daily_agg['sent_sum'] / daily_agg['n']).rename('sentiment_score').reset_index()
+    daily_sentiment['rolling_avg'] = daily_sentiment['sentiment_score'].rolling(window=7, min_periods=1).mean()
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=daily_sentiment['date'],
+        y=daily_sentiment['sentiment_score'],
+        mode='lines+markers',
+        name='Daily Sentiment',
+        line=dict(color='lightblue', width=1),
+        marker=dict(size=4)
+    ))
+    fig.add_trace(go.Scatter(
+        x=daily_sentiment['date'],
+        y=daily_sentiment['rolling_avg'],
+        mode='lines',
+        name='7-Day Average',
+        line=dict(color='blue', width=3)
+    ))
+    fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Date", yaxis_title="Sentiment")
+    dashboard['daily_sentiment_fig'] = fig
+
+    weekly_agg = daily_agg.groupby(daily_agg.index.to_period('W'))[['sent_sum', 'n']].sum()
+    weekly_sentiment = (weekly_agg['sent_sum'] / weekly_agg['n']).rename('sentiment_score').reset_index()
+    weekly_sentiment['week_str'] = weekly_sentiment['date'].astype(str)
+
+    weekly_vals = weekly_sentiment['sentiment_score'].to_numpy()
+    fig = go.Figure(data=[
+        go.Bar(
+            x=weekly_sentiment['week_str'],
+            y=weekly_sentiment['sentiment_score'],
+            marker_color=np.where(weekly_vals > 0, 'green', np.where(weekly_vals < 0, 'red', 'gray'))
+        )
+    ])
+    fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Week", yaxis_title="Avg Sentiment")
+    dashboard['weekly_sentiment_fig'] = fig
+
+    # Stacked area of emotions over time - explode() flattens the per-entry
+    # emotion lists in C instead of an iterrows double loop
+    emotion_df = (df[['date', 'emotions']].explode('emotions')
+                  .rename(columns={'emotions': 'emotion'})
+                  .dropna(subset=['emotion']))
+
+    dashboard['emotion_mix_fig'] = None
+    if not emotion_df.empty:
+        emotion_pivot = emotion_df.groupby(['date', 'emotion']).size().unstack(fill_value=0)
+        # Cap at the 8 most frequent emotions so the stacked area stays
+        # readable and the figure JSON shipped to the browser stays small
+        emotion_pivot = emotion_pivot[emotion_pivot.sum().nlargest(8).index].astype('int32')
+
+        fig = go.Figure()
+        for emotion in emotion_pivot.columns:
+            fig.add_trace(go.Scatter(
+                x=emotion_pivot.index,
+                y=emotion_pivot[emotion],
+                mode='lines',
+                name=emotion,
+                stackgroup='one'
+            ))
+        fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Date", yaxis_title="Emotion Count")
+        dashboard['emotion_mix_fig'] = fig
+
+    # === Risk & Safety Signals ===
+    dashboard['risk_timeline_fig'] = None
+    dashboard['risk_hours_fig'] = None
+    if 'suicide_score' in df.columns:
+        flagged_df = df[df['suicide_score'] >= 0.5].copy()
+
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=flagged_df['date'],
+            y=[1] * len(flagged_df),
+            mode='markers',
+            marker=dict(size=12, color='red', symbol='circle'),
+            name='High Risk',
+            text=flagged_df['text'].str[:50] + '...',
+            hovertemplate='%{x}<br>%{text}<extra></extra>'
+        ))
+        fig.update_layout(
+            height=200,
+            margin=dict(l=0, r=0, t=30, b=0),
+            xaxis_title="Date",
+            yaxis=dict(showticklabels=False),
+            showlegend=False
+        )
+        dashboard['risk_timeline_fig'] = fig
+
+        flagged_hours = df[df['suicide_score'] >= 0.5]['hour']
+
+        fig = go.Figure(data=[
+            go.Histogram(
+                x=flagged_hours,
+                nbinsx=24,
+                marker_color='red'
+            )
+        ])
+        fig.update_layout(
+            height=200,
+            margin=dict(l=0, r=0, t=30, b=0),
+            xaxis_title="Hour of Day",
+            yaxis_title="Flagged Entries"
+        )
+        dashboard['risk_hours_fig'] = fig
+
+    # === Context Impact ===
+    context_df = (df[['date', 'tags', 'sentiment_score']].explode('tags')
+                  .rename(columns={'tags': 'context', 'sentiment_score': 'sentiment'})
+                  .dropna(subset=['context']))
+    # Low-cardinality tag labels repeated per row: int8 codes instead of one
+    # string object each, and groupby hashes levels rather than rows
+    context_df['context'] = context_df['context'].astype('category')
+
+    dashboard['context_sentiment_fig'] = None
+    dashboard['context_over_time_fig'] = None
+    if not context_df.empty:
+        # One groupby yields both the mean sentiment per context and the
+        # counts that pick the top-5 contexts for the time-series chart
+        ctx_stats = context_df.groupby('context', observed=True)['sentiment'].agg(['mean', 'size'])
+        context_avg = ctx_stats['mean'].sort_values(ascending=False)
+
+        context_vals = context_avg.to_numpy()
+        fig = go.Figure(data=[
+            go.Bar(
+                x=context_avg.index,
+                y=context_vals,
+                marker_color=np.where(context_vals > 0, 'green', np.where(context_vals < 0, 'red', 'gray'))
+            )
+        ])
+        fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Context", yaxis_title="Avg Sentiment")
+        dashboard['context_sentiment_fig'] = fig
+
+        # Get top 5 contexts
+        top_contexts = ctx_stats['size'].nlargest(5).index
+
+        fig = go.Figure()
+        # One filter + groupby instead of re-scanning the frame per context
+        top_ctx_df = context_df[context_df['context'].isin(top_contexts)]
+        for context, ctx_df in top_ctx_df.groupby('context', sort=False, observed=True):
+            # .to_numpy() hands plotly raw arrays, skipping its per-Series
+            # conversion path
+            fig.add_trace(go.Scatter(
+                x=ctx_df['date'].to_numpy(),
+                y=ctx_df['sentiment'].to_numpy(),
+                mode='lines+markers',
+                name=context
+            ))
+
+        fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Date", yaxis_title="Sentiment")
+        dashboard['context_over_time_fig'] = fig
+
+    # === Emotion Analytics ===
+    # np.unique on the flattened label array is all the pie charts need -
+    # ~10 emotion classes, no hashed Series histogram required
+    emo_30 = last_30_days['emotions'].explode().dropna().to_numpy()
+
+    dashboard['emotion_30d_pie_fig'] = None
+    if len(emo_30):
+        labels, counts = np.unique(emo_30, return_counts=True)
+        order = np.argsort(-counts)
+        fig = go.Figure(data=[
+            go.Pie(
+                labels=labels[order],
+                values=counts[order],
+                hole=0.4
+            )
+        ])
+        fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0))
+        dashboard['emotion_30d_pie_fig'] = fig
+
+    emo_all = df['emotions'].explode().dropna().to_numpy()
+
+    dashboard['emotion_alltime_pie_fig'] = None
+    if len(emo_all):
+        labels, counts = np.unique(emo_all, return_counts=True)
+        order = np.argsort(-counts)
+        fig = go.Figure(data=[
+            go.Pie(
+                labels=labels[order],
+                values=counts[order],
+                hole=0.4
+            )
+        ])
+        fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0))
+        dashboard['emotion_alltime_pie_fig'] = fig
+
+    # === Language Cues ===
+    # Extract common words (excluding stopwords) - the str accessor runs the
+    # regex in C and the stopword/length filters are vectorized masks
+    tokens = df['text'].str.lower().str.findall(_WORD_RE).explode().dropna()
+    tokens = tokens[(tokens.str.len() > 3) & ~tokens.isin(_STOPWORDS)]
+    word_counts = tokens.value_counts().head(15)
+
+    dashboard['keywords_fig'] = None
+    if not word_counts.empty:
+        fig = go.Figure(data=[
+            go.Bar(
+                x=word_counts.values,
+                y=word_counts.index,
+                orientation='h',
+                marker_color='lightblue'
+            )
+        ])
+        fig.update_layout(height=400, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Frequency", yaxis_title="")
+        dashboard['keywords_fig'] = fig
+
+    fig = go.Figure(data=[
+        go.Scatter(
+            x=df['word_count'],
+            y=df['sentiment_score'],
+            mode='markers',
+            marker=dict(
+                size=8,
+                color=df['sentiment_score'],
+                colorscale='RdYlGn',
+                showscale=True,
+                colorbar=dict(title="Sentiment")
+            ),
+            text=df['date'].dt.strftime('%Y-%m-%d'),
+            hovertemplate='Words: %{x}<br>Sentiment: %{y}<br>Date: %{text}<extra></extra>'
+        )
+    ])
+    fig.update_layout(
+        height=400,
+        margin=dict(l=0, r=0, t=30, b=0),
+        xaxis_title="Word Count",
+        yaxis_title="Sentiment Score"
+    )
+    dashboard['sentiment_length_fig'] = fig
+
+    # === Routines & Patterns ===
+    # floor('D') keeps the group key as datetime64 int arithmetic instead of
+    # materializing Python date objects via .dt.date
+    daily_count = df.groupby(df['date'].dt.floor('D')).size().rename_axis('date').reset_index(name='count')
+
+    fig = go.Figure(data=go.Heatmap(
+        z=daily_count['count'],
+        x=daily_count['date'],
+        y=['Entries'] * len(daily_count),
+        colorscale='Blues',
+        showscale=True
+    ))
+    fig.update_layout(height=150, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Date")
+    dashboard['calendar_heatmap_fig'] = fig
+
+    # Streak values come from the single run-length pass above
+    streak_data = pd.DataFrame({
+        'Streak Type': ['Longest Positive', 'Current Positive', 'Current Negative'],
+        'Days': [max_positive_streak, positive_streak_current, negative_streak_current]
+    })
+
+    fig = go.Figure(data=[
+        go.Bar(
+            x=streak_data['Streak Type'],
+            y=streak_data['Days'],
+            marker_color=['green', 'lightgreen', 'red']
+        )
+    ])
+    fig.update_layout(height=150, margin=dict(l=0, r=0, t=30, b=0), yaxis_title="Days")
+    dashboard['streaks_fig'] = fig
+
+    # Hour x Day of Week Heatmap - observed=True keeps only days with entries,
+    # already in weekday order thanks to the ordered categorical
+    heatmap_data = df.pivot_table(index='day_of_week', columns='hour',
+                                  values='sentiment_score', aggfunc='mean',
+                                  fill_value=0, observed=True)
+
+    fig = go.Figure(data=go.Heatmap(
+        z=heatmap_data.values,
+        x=heatmap_data.columns,
+        y=heatmap_data.index,
+        colorscale='RdYlGn',
+        zmid=0
+    ))
+    fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Hour of Day", yaxis_title="Day of Week")
+    dashboard['hour_dow_heatmap_fig'] = fig
+
+    # === Writing Patterns ===
+    dashboard['avg_length'] = df['text_length'].mean()
+    dashboard['avg_words'] = df['word_count'].mean()
+    dashboard['total_entries'] = len(df)
+
+    return dashboard
+
+
+def _render_dashboard(dashboard: dict):
+    """Render the pre-built analytics dashboard."""
+    # === 7) KPIs (Top of Dashboard) ===
+    st.markdown("### 🎯 Key Performance Indicators")
+
+    avg_sentiment_7d = dashboard['avg_sentiment_7d']
+    max_positive_streak = dashboard['max_positive_streak']
+    suicide_pct_30d = dashboard['suicide_pct_30d']
+
+    # Display KPIs with improved formatting
+    kpi1, kpi2, kpi3, kpi4, kpi5 = st.columns(5)
+
+    with kpi1:
+        # Sentiment: -1 (negative) to +1 (positive)
+        sentiment_emoji = "😊" if avg_sentiment_7d > 0.3 else "😐" if avg_sentiment_7d >= -0.3 else "😔"
+        sentiment_label = "Positive" if avg_sentiment_7d > 0.3 else "Neutral" if avg_sentiment_7d >= -0.3 else "Negative"
+
+        st.metric(
+            "7-Day Avg Mood",
+            f"{sentiment_emoji} {sentiment_label}",
+            delta=f"Score: {avg_sentiment_7d:+.2f}" if dashboard['n_7d'] > 0 else "No data",
+            help="Average sentiment from -1 (very negative) to +1 (very positive)"
+        )
+
+    with kpi2:
+        # Risk percentage with better display
+        risk_count = dashboard['risk_count']
+        risk_color = "🟢" if suicide_pct_30d == 0 else "🟡" if suicide_pct_30d < 10 else "🔴"
+
+        st.metric(
+            "Risk Alerts (30d)",
+            f"{risk_color} {risk_count} entries" if dashboard['n_30d'] > 0 else "🟢 No data",
+            delta=f"{suicide_pct_30d:.1f}% of total" if dashboard['n_30d'] > 0 else None,
+            delta_color="inverse" if suicide_pct_30d > 0 else "off",
+            help=f"High-risk entries detected in last 30 days ({risk_count} out of {dashboard['n_30d']} total entries)"
+        )
+
+    with kpi3:
+        streak_display = f"🔥 {max_positive_streak}" if max_positive_streak > 0 else "—"
+        streak_label = "days" if max_positive_streak != 1 else "day"
+
+        st.metric(
+            "Longest Positive Streak",
+            f"{streak_display} {streak_label}" if max_positive_streak > 0 else "No streak yet",
+            help="Consecutive days with positive sentiment (score > 0)"
+        )
+
+    with kpi4:
+        st.metric(
+            "Top Emotion (30d)",
+            f"🎭 {dashboard['most_freq_emotion']}",
+            help="Most frequently detected emotion in last 30 days"
+        )
+
+    with kpi5:
+        st.metric(
+            "Top Context (30d)",
+            f"🏷️ {dashboard['most_freq_context']}",
+            help="Most common topic/context in last 30 days"
+        )
+
+    st.markdown("---")
+
+    # === 1) Trends Over Time ===
+    st.markdown("### 📈 Trends Over Time")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### Daily Sentiment & 7-Day Average")
+        st.plotly_chart(dashboard['daily_sentiment_fig'], use_container_width=True, key="daily_sentiment_chart")
+
+    with col2:
+        st.markdown("#### Weekly Average Sentiment")
+        st.plotly_chart(dashboard['weekly_sentiment_fig'], use_container_width=True, key="weekly_sentiment_chart")
+
+    st.markdown("#### Emotional Mix Over Time")
+    if dashboard['emotion_mix_fig'] is not None:
+        st.plotly_chart(dashboard['emotion_mix_fig'], use_container_width=True, key="emotion_stacked_area_chart")
+
+    st.markdown("---")
+
+    # === 2) Risk & Safety Signals ===
+    st.markdown("### 🚨 Risk & Safety Signals")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### Timeline of Flagged Entries")
+        if dashboard['risk_timeline_fig'] is not None:
+            st.plotly_chart(dashboard['risk_timeline_fig'], use_container_width=True, key="risk_timeline_chart")
+        else:
+            st.info("No risk data available")
+
+    with col2:
+        st.markdown("#### Time-of-Day Risk Pattern")
+        if dashboard['risk_hours_fig'] is not None:
+            st.plotly_chart(dashboard['risk_hours_fig'], use_container_width=True, key="risk_hour_histogram")
+        else:
+            st.info("No risk data available")
+
+    st.markdown("---")
+
+    # === 3) Context Impact ===
+    st.markdown("### 🎯 Context Impact Analysis")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### Average Sentiment by Context")
+        if dashboard['context_sentiment_fig'] is not None:
+            st.plotly_chart(dashboard['context_sentiment_fig'], use_container_width=True, key="context_sentiment_bar_chart")
+        else:
+            st.info("No context data available")
+
+    with col2:
+        st.markdown("#### Sentiment Over Time by Context")
+        if dashboard['context_over_time_fig'] is not None:
+            st.plotly_chart(dashboard['context_over_time_fig'], use_container_width=True, key="context_sentiment_line_chart")
+        else:
+            st.info("No context data available")
+
+    st.markdown("---")
+
+    # === 4) Emotion Analytics ===
+    st.markdown("### 🎭 Emotion Analytics")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### Emotion Distribution (Last 30 Days)")
+        if dashboard['emotion_30d_pie_fig'] is not None:
+            st.plotly_chart(dashboard['emotion_30d_pie_fig'], use_container_width=True, key="emotion_30day_pie_chart")
+        else:
+            st.info("No emotion data available")
+
+    with col2:
+        st.markdown("#### All-Time Emotion Distribution")
+        if dashboard['emotion_alltime_pie_fig'] is not None:
+            st.plotly_chart(dashboard['emotion_alltime_pie_fig'], use_container_width=True, key="emotion_alltime_pie_chart")
+        else:
+            st.info("No emotion data available")
+
+    st.markdown("---")
+
+    # === 5) Language Cues ===
+    st.markdown("### 💬 Language Cues & Patterns")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### Common Keywords")
+        if dashboard['keywords_fig'] is not None:
+            st.plotly_chart(dashboard['keywords_fig'], use_container_width=True, key="keyword_frequency_chart")
+        else:
+            st.info("Not enough text data")
+
+    with col2:
+        st.markdown("#### Sentiment vs Entry Length")
+        st.plotly_chart(dashboard['sentiment_length_fig'], use_container_width=True, key="sentiment_length_scatter")
+
+    st.markdown("---")
+
+    # === 6) Routines & Patterns ===
+    st.markdown("### 🗓️ Routines & Patterns")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### Calendar Heatmap - Entry Count")
+        st.plotly_chart(dashboard['calendar_heatmap_fig'], use_container_width=True, key="calendar_heatmap_chart")
+
+    with col2:
+        st.markdown("#### Sentiment Streaks")
+        st.plotly_chart(dashboard['streaks_fig'], use_container_width=True, key="sentiment_streaks_chart")
+
+    # Hour x Day of Week Heatmap
+    st.markdown("#### Hour × Day of Week - Average Sentiment")
+    st.plotly_chart(dashboard['hour_dow_heatmap_fig'], use_container_width=True, key="hour_dayofweek_heatmap")
+
+    st.markdown("---")
+
+    # === Writing Patterns ===
+    st.markdown("### ✍️ Writing Patterns")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Average Text Length", f"{dashboard['avg_length']:.0f} characters")
+    with col2:
+        st.metric("Average Word Count", f"{dashboard['avg_words']:.0f} words")
+    with col3:
+        st.metric("Total Entries", dashboard['total_entries'])
+
+
 def statistics_page():
     """Page for viewing statistics."""
     st.markdown("""
@@ -1607,578 +2108,65 @@ def statistics_page():
     """, unsafe_allow_html=True)
     
     try:
-        stats = st.session_state.app.get_stats()
-        
+        stats = _cached_stats(id(st.session_state.app))
+
         st.markdown("### 🖥️ System Information")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
+        st.markdown(f"""
+        <div style="display: flex; gap: 1rem;">
+            <div class="metric-card" style="flex: 1;">
                 <h3>🗄️ Vector Store</h3>
                 <h2>{stats['vector_store'].title()}</h2>
             </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
+            <div class="metric-card" style="flex: 1;">
                 <h3>🤖 LLM Backend</h3>
                 <h2>{stats['llm_backend'].title()}</h2>
             </div>
-            """, unsafe_allow_html=True)
-        
+        </div>
+        """, unsafe_allow_html=True)
+
         st.markdown("### 🧠 Model Status")
         models = stats['models_loaded']
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            status = "✅ Loaded" if models['emotion_model'] else "❌ Not loaded"
-            st.markdown(f"""
-            <div class="metric-card">
+        emotion_status = "✅ Loaded" if models['emotion_model'] else "❌ Not loaded"
+        tagger_status = "✅ Loaded" if models['context_tagger'] else "❌ Not loaded"
+        embedder_status = "✅ Loaded" if models['embedder'] else "❌ Not loaded"
+        st.markdown(f"""
+        <div style="display: flex; gap: 1rem;">
+            <div class="metric-card" style="flex: 1;">
                 <h3>🎭 Emotion Model</h3>
-                <h2>{status}</h2>
+                <h2>{emotion_status}</h2>
             </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            status = "✅ Loaded" if models['context_tagger'] else "❌ Not loaded"
-            st.markdown(f"""
-            <div class="metric-card">
+            <div class="metric-card" style="flex: 1;">
                 <h3>🏷️ Context Tagger</h3>
-                <h2>{status}</h2>
+                <h2>{tagger_status}</h2>
             </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            status = "✅ Loaded" if models['embedder'] else "❌ Not loaded"
-            st.markdown(f"""
-            <div class="metric-card">
+            <div class="metric-card" style="flex: 1;">
                 <h3>🔗 Embedder</h3>
-                <h2>{status}</h2>
+                <h2>{embedder_status}</h2>
             </div>
-            """, unsafe_allow_html=True)
+        </div>
+        """, unsafe_allow_html=True)
         
         # Add comprehensive analytics dashboard
         st.markdown("### 📊 Detailed Analytics Dashboard")
-        
+
         try:
             # Get real data from entries
             entries_file = Path("data/entries.jsonl")
             if entries_file.exists():
-                entries = []
-                with open(entries_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if line.strip():
-                            entries.append(json.loads(line))
-                
-                if entries:
-                    # Process real data
-                    df = pd.DataFrame(entries)
-                    df['date'] = pd.to_datetime(df['date'])
-                    df['text_length'] = df['text'].str.len()
-                    df['word_count'] = df['text'].str.split().str.len()
-                    
-                    # Extract hour from timestamp if available
-                    if 'timestamp' in df.columns:
-                        df['hour'] = pd.to_datetime(df['timestamp']).dt.hour
-                    else:
-                        df['hour'] = 12  # Default to noon if no timestamp
-                    
-                    df['day_of_week'] = df['date'].dt.day_name()
-                    df['week'] = df['date'].dt.to_period('W')
-                    
-                    # Calculate sentiment score (1=positive, 0=neutral, -1=negative)
-                    sentiment_map = {'positive': 1, 'neutral': 0, 'negative': -1}
-                    df['sentiment_score'] = df['sentiment'].map(sentiment_map).fillna(0)
-                    
-                    # === 7) KPIs (Top of Dashboard) ===
-                    st.markdown("### 🎯 Key Performance Indicators")
-                    
-                    # Calculate KPIs
-                    last_7_days = df[df['date'] >= (pd.Timestamp.now() - pd.Timedelta(days=7))]
-                    last_30_days = df[df['date'] >= (pd.Timestamp.now() - pd.Timedelta(days=30))]
-                    
-                    avg_sentiment_7d = last_7_days['sentiment_score'].mean() if len(last_7_days) > 0 else 0
-                    
-                    # Check for suicidal thoughts
-                    suicide_flagged = df['suicide_score'] >= 0.5 if 'suicide_score' in df.columns else pd.Series([False] * len(df))
-                    suicide_pct_30d = (suicide_flagged[df['date'] >= (pd.Timestamp.now() - pd.Timedelta(days=30))].sum() / len(last_30_days) * 100) if len(last_30_days) > 0 else 0
-                    
-                    # Calculate longest positive streak
-                    positive_streak = 0
-                    max_positive_streak = 0
-                    for score in df.sort_values('date')['sentiment_score']:
-                        if score > 0:
-                            positive_streak += 1
-                            max_positive_streak = max(max_positive_streak, positive_streak)
-                        else:
-                            positive_streak = 0
-                    
-                    # Most frequent emotion and context
-                    all_emotions = []
-                    for emotions_list in last_30_days['emotions']:
-                        if emotions_list:
-                            all_emotions.extend(emotions_list)
-                    most_freq_emotion = pd.Series(all_emotions).value_counts().index[0] if all_emotions else 'N/A'
-                    
-                    all_tags = []
-                    for tags_list in last_30_days['tags']:
-                        if tags_list:
-                            all_tags.extend(tags_list)
-                    most_freq_context = pd.Series(all_tags).value_counts().index[0] if all_tags else 'N/A'
-                    
-                    # Display KPIs with improved formatting
-                    kpi1, kpi2, kpi3, kpi4, kpi5 = st.columns(5)
-                    
-                    with kpi1:
-                        # Sentiment: -1 (negative) to +1 (positive)
-                        sentiment_emoji = "😊" if avg_sentiment_7d > 0.3 else "😐" if avg_sentiment_7d >= -0.3 else "😔"
-                        sentiment_label = "Positive" if avg_sentiment_7d > 0.3 else "Neutral" if avg_sentiment_7d >= -0.3 else "Negative"
-                        
-                        st.metric(
-                            "7-Day Avg Mood",
-                            f"{sentiment_emoji} {sentiment_label}",
-                            delta=f"Score: {avg_sentiment_7d:+.2f}" if len(last_7_days) > 0 else "No data",
-                            help="Average sentiment from -1 (very negative) to +1 (very positive)"
-                        )
-                    
-                    with kpi2:
-                        # Risk percentage with better display
-                        risk_count = int(suicide_flagged[df['date'] >= (pd.Timestamp.now() - pd.Timedelta(days=30))].sum())
-                        risk_color = "🟢" if suicide_pct_30d == 0 else "🟡" if suicide_pct_30d < 10 else "🔴"
-                        
-                        st.metric(
-                            "Risk Alerts (30d)",
-                            f"{risk_color} {risk_count} entries" if len(last_30_days) > 0 else "🟢 No data",
-                            delta=f"{suicide_pct_30d:.1f}% of total" if len(last_30_days) > 0 else None,
-                            delta_color="inverse" if suicide_pct_30d > 0 else "off",
-                            help=f"High-risk entries detected in last 30 days ({risk_count} out of {len(last_30_days)} total entries)"
-                        )
-                    
-                    with kpi3:
-                        streak_display = f"🔥 {max_positive_streak}" if max_positive_streak > 0 else "—"
-                        streak_label = "days" if max_positive_streak != 1 else "day"
-                        
-                        st.metric(
-                            "Longest Positive Streak",
-                            f"{streak_display} {streak_label}" if max_positive_streak > 0 else "No streak yet",
-                            help="Consecutive days with positive sentiment (score > 0)"
-                        )
-                    
-                    with kpi4:
-                        st.metric(
-                            "Top Emotion (30d)",
-                            f"🎭 {most_freq_emotion}",
-                            help="Most frequently detected emotion in last 30 days"
-                        )
-                    
-                    with kpi5:
-                        st.metric(
-                            "Top Context (30d)",
-                            f"🏷️ {most_freq_context}",
-                            help="Most common topic/context in last 30 days"
-                        )
-                    
-                    st.markdown("---")
-                    
-                    # === 1) Trends Over Time ===
-                    st.markdown("### 📈 Trends Over Time")
-                    
-                    # Daily sentiment with 7-day rolling average
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.markdown("#### Daily Sentiment & 7-Day Average")
-                        daily_sentiment = df.groupby('date')['sentiment_score'].mean().reset_index()
-                        daily_sentiment['rolling_avg'] = daily_sentiment['sentiment_score'].rolling(window=7, min_periods=1).mean()
-                        
-                        import plotly.graph_objects as go
-                        fig = go.Figure()
-                        fig.add_trace(go.Scatter(
-                            x=daily_sentiment['date'],
-                            y=daily_sentiment['sentiment_score'],
-                            mode='lines+markers',
-                            name='Daily Sentiment',
-                            line=dict(color='lightblue', width=1),
-                            marker=dict(size=4)
-                        ))
-                        fig.add_trace(go.Scatter(
-                            x=daily_sentiment['date'],
-                            y=daily_sentiment['rolling_avg'],
-                            mode='lines',
-                            name='7-Day Average',
-                            line=dict(color='blue', width=3)
-                        ))
-                        fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Date", yaxis_title="Sentiment")
-                        st.plotly_chart(fig, use_container_width=True, key="daily_sentiment_chart")
-                    
-                    with col2:
-                        st.markdown("#### Weekly Average Sentiment")
-                        weekly_sentiment = df.groupby('week')['sentiment_score'].mean().reset_index()
-                        weekly_sentiment['week_str'] = weekly_sentiment['week'].astype(str)
-                        
-                        fig = go.Figure(data=[
-                            go.Bar(
-                                x=weekly_sentiment['week_str'],
-                                y=weekly_sentiment['sentiment_score'],
-                                marker_color=['green' if x > 0 else 'red' if x < 0 else 'gray' for x in weekly_sentiment['sentiment_score']]
-                            )
-                        ])
-                        fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Week", yaxis_title="Avg Sentiment")
-                        st.plotly_chart(fig, use_container_width=True, key="weekly_sentiment_chart")
-                    
-                    # Stacked area of emotions over time
-                    st.markdown("#### Emotional Mix Over Time")
-                    emotion_data = []
-                    for idx, row in df.iterrows():
-                        for emotion in row['emotions'] if row['emotions'] else []:
-                            emotion_data.append({'date': row['date'], 'emotion': emotion})
-                    
-                    if emotion_data:
-                        emotion_df = pd.DataFrame(emotion_data)
-                        emotion_pivot = emotion_df.groupby(['date', 'emotion']).size().unstack(fill_value=0)
-                        
-                        fig = go.Figure()
-                        for emotion in emotion_pivot.columns:
-                            fig.add_trace(go.Scatter(
-                                x=emotion_pivot.index,
-                                y=emotion_pivot[emotion],
-                                mode='lines',
-                                name=emotion,
-                                stackgroup='one'
-                            ))
-                        fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Date", yaxis_title="Emotion Count")
-                        st.plotly_chart(fig, use_container_width=True, key="emotion_stacked_area_chart")
-                    
-                    st.markdown("---")
-                    
-                    # === 2) Risk & Safety Signals ===
-                    st.markdown("### 🚨 Risk & Safety Signals")
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.markdown("#### Timeline of Flagged Entries")
-                        if 'suicide_score' in df.columns:
-                            flagged_df = df[df['suicide_score'] >= 0.5].copy()
-                            
-                            fig = go.Figure()
-                            fig.add_trace(go.Scatter(
-                                x=flagged_df['date'],
-                                y=[1] * len(flagged_df),
-                                mode='markers',
-                                marker=dict(size=12, color='red', symbol='circle'),
-                                name='High Risk',
-                                text=flagged_df['text'].str[:50] + '...',
-                                hovertemplate='%{x}<br>%{text}<extra></extra>'
-                            ))
-                            fig.update_layout(
-                                height=200,
-                                margin=dict(l=0, r=0, t=30, b=0),
-                                xaxis_title="Date",
-                                yaxis=dict(showticklabels=False),
-                                showlegend=False
-                            )
-                            st.plotly_chart(fig, use_container_width=True, key="risk_timeline_chart")
-                        else:
-                            st.info("No risk data available")
-                    
-                    with col2:
-                        st.markdown("#### Time-of-Day Risk Pattern")
-                        if 'suicide_score' in df.columns:
-                            flagged_hours = df[df['suicide_score'] >= 0.5]['hour']
-                            
-                            fig = go.Figure(data=[
-                                go.Histogram(
-                                    x=flagged_hours,
-                                    nbinsx=24,
-                                    marker_color='red'
-                                )
-                            ])
-                            fig.update_layout(
-                                height=200,
-                                margin=dict(l=0, r=0, t=30, b=0),
-                                xaxis_title="Hour of Day",
-                                yaxis_title="Flagged Entries"
-                            )
-                            st.plotly_chart(fig, use_container_width=True, key="risk_hour_histogram")
-                        else:
-                            st.info("No risk data available")
-                    
-                    st.markdown("---")
-                    
-                    # === 3) Context Impact ===
-                    st.markdown("### 🎯 Context Impact Analysis")
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.markdown("#### Average Sentiment by Context")
-                        context_sentiment = []
-                        for idx, row in df.iterrows():
-                            for tag in row['tags'] if row['tags'] else []:
-                                context_sentiment.append({'context': tag, 'sentiment': row['sentiment_score']})
-                        
-                        if context_sentiment:
-                            context_df = pd.DataFrame(context_sentiment)
-                            context_avg = context_df.groupby('context')['sentiment'].mean().reset_index().sort_values('sentiment', ascending=False)
-                            
-                            fig = go.Figure(data=[
-                                go.Bar(
-                                    x=context_avg['context'],
-                                    y=context_avg['sentiment'],
-                                    marker_color=['green' if x > 0 else 'red' if x < 0 else 'gray' for x in context_avg['sentiment']]
-                                )
-                            ])
-                            fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Context", yaxis_title="Avg Sentiment")
-                            st.plotly_chart(fig, use_container_width=True, key="context_sentiment_bar_chart")
-                        else:
-                            st.info("No context data available")
-                    
-                    with col2:
-                        st.markdown("#### Sentiment Over Time by Context")
-                        if context_sentiment:
-                            # Get top 5 contexts
-                            top_contexts = context_df['context'].value_counts().head(5).index
-                            
-                            fig = go.Figure()
-                            for context in top_contexts:
-                                context_time_data = []
-                                for idx, row in df.iterrows():
-                                    if row['tags'] and context in row['tags']:
-                                        context_time_data.append({'date': row['date'], 'sentiment': row['sentiment_score']})
-                                
-                                if context_time_data:
-                                    ctx_df = pd.DataFrame(context_time_data)
-                                    fig.add_trace(go.Scatter(
-                                        x=ctx_df['date'],
-                                        y=ctx_df['sentiment'],
-                                        mode='lines+markers',
-                                        name=context
-                                    ))
-                            
-                            fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Date", yaxis_title="Sentiment")
-                            st.plotly_chart(fig, use_container_width=True, key="context_sentiment_line_chart")
-                        else:
-                            st.info("No context data available")
-                    
-                    st.markdown("---")
-                    
-                    # === 4) Emotion Analytics ===
-                    st.markdown("### 🎭 Emotion Analytics")
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.markdown("#### Emotion Distribution (Last 30 Days)")
-                        last_30_emotions = []
-                        for idx, row in last_30_days.iterrows():
-                            if row['emotions']:
-                                last_30_emotions.extend(row['emotions'])
-                        
-                        if last_30_emotions:
-                            emotion_counts = pd.Series(last_30_emotions).value_counts()
-                            
-                            fig = go.Figure(data=[
-                                go.Pie(
-                                    labels=emotion_counts.index,
-                                    values=emotion_counts.values,
-                                    hole=0.4
-                                )
-                            ])
-                            fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0))
-                            st.plotly_chart(fig, use_container_width=True, key="emotion_30day_pie_chart")
-                        else:
-                            st.info("No emotion data available")
-                    
-                    with col2:
-                        st.markdown("#### All-Time Emotion Distribution")
-                        all_emotions_ever = []
-                        for idx, row in df.iterrows():
-                            if row['emotions']:
-                                all_emotions_ever.extend(row['emotions'])
-                        
-                        if all_emotions_ever:
-                            emotion_counts_all = pd.Series(all_emotions_ever).value_counts()
-                            
-                            fig = go.Figure(data=[
-                                go.Pie(
-                                    labels=emotion_counts_all.index,
-                                    values=emotion_counts_all.values,
-                                    hole=0.4
-                                )
-                            ])
-                            fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0))
-                            st.plotly_chart(fig, use_container_width=True, key="emotion_alltime_pie_chart")
-                        else:
-                            st.info("No emotion data available")
-                    
-                    st.markdown("---")
-                    
-                    # === 5) Language Cues ===
-                    st.markdown("### 💬 Language Cues & Patterns")
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.markdown("#### Common Keywords")
-                        # Extract common words (excluding stopwords)
-                        from collections import Counter
-                        import re
-                        
-                        stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'is', 'was', 'are', 'were', 'been', 'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'my', 'your', 'his', 'her', 'its', 'our', 'their', 'this', 'that', 'these', 'those'}
-                        
-                        all_words = []
-                        for text in df['text']:
-                            words = re.findall(r'\b[a-z]+\b', text.lower())
-                            all_words.extend([w for w in words if w not in stopwords and len(w) > 3])
-                        
-                        if all_words:
-                            word_counts = Counter(all_words).most_common(15)
-                            words_df = pd.DataFrame(word_counts, columns=['Word', 'Count'])
-                            
-                            fig = go.Figure(data=[
-                                go.Bar(
-                                    x=words_df['Count'],
-                                    y=words_df['Word'],
-                                    orientation='h',
-                                    marker_color='lightblue'
-                                )
-                            ])
-                            fig.update_layout(height=400, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Frequency", yaxis_title="")
-                            st.plotly_chart(fig, use_container_width=True, key="keyword_frequency_chart")
-                        else:
-                            st.info("Not enough text data")
-                    
-                    with col2:
-                        st.markdown("#### Sentiment vs Entry Length")
-                        fig = go.Figure(data=[
-                            go.Scatter(
-                                x=df['word_count'],
-                                y=df['sentiment_score'],
-                                mode='markers',
-                                marker=dict(
-                                    size=8,
-                                    color=df['sentiment_score'],
-                                    colorscale='RdYlGn',
-                                    showscale=True,
-                                    colorbar=dict(title="Sentiment")
-                                ),
-                                text=df['date'].dt.strftime('%Y-%m-%d'),
-                                hovertemplate='Words: %{x}<br>Sentiment: %{y}<br>Date: %{text}<extra></extra>'
-                            )
-                        ])
-                        fig.update_layout(
-                            height=400,
-                            margin=dict(l=0, r=0, t=30, b=0),
-                            xaxis_title="Word Count",
-                            yaxis_title="Sentiment Score"
-                        )
-                        st.plotly_chart(fig, use_container_width=True, key="sentiment_length_scatter")
-                    
-                    st.markdown("---")
-                    
-                    # === 6) Routines & Patterns ===
-                    st.markdown("### 🗓️ Routines & Patterns")
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.markdown("#### Calendar Heatmap - Entry Count")
-                        daily_count = df.groupby(df['date'].dt.date).size().reset_index(name='count')
-                        daily_count.columns = ['date', 'count']
-                        
-                        fig = go.Figure(data=go.Heatmap(
-                            z=daily_count['count'],
-                            x=daily_count['date'],
-                            y=['Entries'] * len(daily_count),
-                            colorscale='Blues',
-                            showscale=True
-                        ))
-                        fig.update_layout(height=150, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Date")
-                        st.plotly_chart(fig, use_container_width=True, key="calendar_heatmap_chart")
-                    
-                    with col2:
-                        st.markdown("#### Sentiment Streaks")
-                        
-                        # Calculate streaks
-                        positive_streak_current = 0
-                        negative_streak_current = 0
-                        neutral_streak_current = 0
-                        
-                        for score in df.sort_values('date', ascending=False)['sentiment_score']:
-                            if score > 0:
-                                positive_streak_current += 1
-                                break
-                            else:
-                                break
-                        
-                        for score in df.sort_values('date', ascending=False)['sentiment_score']:
-                            if score < 0:
-                                negative_streak_current += 1
-                                break
-                            else:
-                                break
-                        
-                        streak_data = pd.DataFrame({
-                            'Streak Type': ['Longest Positive', 'Current Positive', 'Current Negative'],
-                            'Days': [max_positive_streak, positive_streak_current, negative_streak_current]
-                        })
-                        
-                        fig = go.Figure(data=[
-                            go.Bar(
-                                x=streak_data['Streak Type'],
-                                y=streak_data['Days'],
-                                marker_color=['green', 'lightgreen', 'red']
-                            )
-                        ])
-                        fig.update_layout(height=150, margin=dict(l=0, r=0, t=30, b=0), yaxis_title="Days")
-                        st.plotly_chart(fig, use_container_width=True, key="sentiment_streaks_chart")
-                    
-                    # Hour x Day of Week Heatmap
-                    st.markdown("#### Hour × Day of Week - Average Sentiment")
-                    heatmap_data = df.groupby(['day_of_week', 'hour'])['sentiment_score'].mean().unstack(fill_value=0)
-                    
-                    # Reorder days
-                    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-                    heatmap_data = heatmap_data.reindex([d for d in day_order if d in heatmap_data.index])
-                    
-                    fig = go.Figure(data=go.Heatmap(
-                        z=heatmap_data.values,
-                        x=heatmap_data.columns,
-                        y=heatmap_data.index,
-                        colorscale='RdYlGn',
-                        zmid=0
-                    ))
-                    fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0), xaxis_title="Hour of Day", yaxis_title="Day of Week")
-                    st.plotly_chart(fig, use_container_width=True, key="hour_dayofweek_heatmap")
-                    
-                    st.markdown("---")
-                    
-                    # === Writing Patterns ===
-                    st.markdown("### ✍️ Writing Patterns")
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        avg_length = df['text_length'].mean()
-                        st.metric("Average Text Length", f"{avg_length:.0f} characters")
-                    with col2:
-                        avg_words = df['word_count'].mean()
-                        st.metric("Average Word Count", f"{avg_words:.0f} words")
-                    with col3:
-                        total_entries = len(df)
-                        st.metric("Total Entries", total_entries)
-                    
+                # Keyed on the file's mtime: reruns with unchanged data reuse
+                # the cached figures instead of redoing the pandas/plotly work
+                dashboard = _build_dashboard(entries_file.stat().st_mtime)
+                if dashboard is not None:
+                    _render_dashboard(dashboard)
                 else:
                     st.info("📝 No entries found. Add some diary entries to see detailed analytics!")
             else:
                 st.info("📝 No data file found. Add some diary entries to see detailed analytics!")
-                
+
         except Exception as e:
             st.error(f"❌ Error generating analytics: {e}")
-            import traceback
             st.code(traceback.format_exc())
-        
+
     except Exception as e:
         st.error(f"❌ Error loading statistics: {e}")
 
@@ -2315,19 +2303,16 @@ def view_entries_page():
             st.info("📝 No entries found. Start by adding your first diary entry!")
             return
         
-        # Read all entries
-        entries = []
-        with open(entries_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    entries.append(json.loads(line))
-        
+        # Read all entries (binary read + orjson avoids per-line decode overhead)
+        with open(entries_file, 'rb') as f:
+            entries = [_json_loads(line) for line in f if line.strip()]
+
         if not entries:
             st.info("📝 No entries found. Start by adding your first diary entry!")
             return
-        
+
         # Sort entries by date (newest first)
-        entries.sort(key=lambda x: x.get('date', ''), reverse=True)
+        entries.sort(key=itemgetter('date'), reverse=True)
         
         st.markdown(f"### 📊 Total Entries: {len(entries)}")
         
@@ -2338,12 +2323,17 @@ def view_entries_page():
         with col2:
             date_filter = st.date_input("📅 Filter by date", value=None)
         
-        # Filter entries
+        # Filter entries - both conditions in a single pass instead of one
+        # intermediate list per active filter
         filtered_entries = entries
-        if search_text:
-            filtered_entries = [e for e in filtered_entries if search_text.lower() in e.get('text', '').lower()]
-        if date_filter:
-            filtered_entries = [e for e in filtered_entries if e.get('date') == date_filter.isoformat()]
+        if search_text or date_filter:
+            needle = search_text.lower() if search_text else None
+            date_iso = date_filter.isoformat() if date_filter else None
+            filtered_entries = [
+                e for e in entries
+                if (needle is None or needle in e.get('text', '').lower())
+                and (date_iso is None or e.get('date') == date_iso)
+            ]
         
         st.markdown(f"### 📋 Showing {len(filtered_entries)} entries")
         
@@ -2383,6 +2373,9 @@ def view_entries_page():
                         try:
                             if hasattr(st.session_state, 'app') and hasattr(st.session_state.app, 'vector_store'):
                                 st.session_state.app.vector_store.reload()
+                                st.session_state.app.search_cache.clear()
+                                _path_exists.cache_clear()
+                                _summary_and_related.clear()
                         except Exception as reload_error:
                             print(f"Warning: Could not reload vector store: {reload_error}")
                         
@@ -2408,102 +2401,92 @@ def view_entries_page():
                 st.session_state.show_delete_selection = False
                 st.rerun()
         
+        # Paginate so a long journal renders 25 expanders per rerun instead
+        # of one widget tree per entry
+        page_size = 25
+        n_pages = max(1, -(-len(filtered_entries) // page_size))
+        page = 1
+        if n_pages > 1:
+            page = st.number_input(f"📄 Page (1-{n_pages})", min_value=1, max_value=n_pages, value=1)
+        start = (page - 1) * page_size
+
         # Display entries
-        for i, entry in enumerate(filtered_entries, 1):
+        for i, entry in enumerate(filtered_entries[start:start + page_size], start + 1):
             with st.expander(f"📝 Entry {i} - {entry.get('date', 'Unknown Date')}", expanded=False):
+                emotions = entry.get('emotions', [])
+                tags = entry.get('tags', [])
+
+                # Build the static cards as one HTML blob: every st.markdown
+                # call is a separate Streamlit delta message, so batching cuts
+                # the per-entry message count to one
+                risk_card = ""
+                if entry.get('suicide_score') is not None:
+                    suicide_score = entry.get('suicide_score', 0.0)
+                    if suicide_score >= 0.5:
+                        risk_color, risk_level = "#ff6b6b", "High Risk"
+                    else:
+                        risk_color, risk_level = "#4caf50", "Low Risk"
+                    risk_card = f"""
+                <div class="metric-card" style="border-left: 6px solid {risk_color}; margin: 1rem 0;">
+                    <h3>🛡️ Mental Health Risk</h3>
+                    <h2 style="color: {risk_color};">{risk_level}</h2>
+                    <p style="font-size: 0.8em; margin: 0;">Score: {suicide_score:.2f}</p>
+                </div>"""
+
+                emotion_badges = ""
+                if emotions:
+                    badges = "".join(f'<span class="emotion-badge">{emotion}</span>' for emotion in emotions)
+                    emotion_badges = f"<h3>🎭 Emotions</h3><div>{badges}</div>"
+
+                tag_badges = ""
+                if tags:
+                    badges = "".join(f'<span class="tag-badge">{tag}</span>' for tag in tags)
+                    tag_badges = f"<h3>🏷️ Tags</h3><div>{badges}</div>"
+
                 st.markdown(f"""
                 <div class="entry-card">
                     <h4>📅 {entry.get('date', 'Unknown Date')}</h4>
                     <p><strong>Text:</strong> {entry.get('text', 'No text available')}</p>
+                </div>{risk_card}
+                <div style="display: flex; gap: 1rem;">
+                    <div class="metric-card" style="flex: 1;">
+                        <h3>😊 Sentiment</h3>
+                        <h2>{entry.get('sentiment', 'Unknown').title()}</h2>
+                    </div>
+                    <div class="metric-card" style="flex: 1;">
+                        <h3>🎭 Emotions</h3>
+                        <h2>{', '.join(emotions) if emotions else 'None'}</h2>
+                    </div>
+                    <div class="metric-card" style="flex: 1;">
+                        <h3>🏷️ Tags</h3>
+                        <h2>{', '.join(tags) if tags else 'None'}</h2>
+                    </div>
                 </div>
+                {emotion_badges}
+                {tag_badges}
                 """, unsafe_allow_html=True)
-                
-                # Show suicide risk if available
-                if entry.get('suicide_score') is not None:
-                    suicide_score = entry.get('suicide_score', 0.0)
-                    suicide_prediction = entry.get('suicide_prediction', 'Unknown')
-                    if suicide_score >= 0.5:
-                        risk_color = "#ff6b6b"
-                        risk_level = "High Risk"
-                    else:
-                        risk_color = "#4caf50"
-                        risk_level = "Low Risk"
-                    
-                    st.markdown(f"""
-                    <div class="metric-card" style="border-left: 6px solid {risk_color}; margin: 1rem 0;">
-                        <h3>🛡️ Mental Health Risk</h3>
-                        <h2 style="color: {risk_color};">{risk_level}</h2>
-                        <p style="font-size: 0.8em; margin: 0;">Score: {suicide_score:.2f}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
 
-                # Show image if available
+                # Media keeps its native Streamlit widgets, after the cards
                 if entry.get('image_path'):
                     st.markdown("### 🖼️ Image")
                     try:
-                        st.image(str(entry.get('image_path')))
+                        _render_image(str(entry.get('image_path')))
                         if entry.get('image_desc'):
                             st.caption(f"Description: {entry.get('image_desc')}")
                     except Exception:
                         st.info("Image associated but could not be previewed.")
-                
-                # Show video if available
+
                 if entry.get('video_path'):
                     st.markdown("### 🎥 Video")
                     try:
                         video_path = Path(entry.get('video_path'))
-                        if video_path.exists():
+                        if _path_exists(str(video_path)):
                             st.video(str(video_path))
                         else:
                             st.warning(f"⚠️ Video file not found: {entry.get('video_path')}")
                     except Exception as e:
                         st.info(f"Video associated but could not be previewed: {e}")
-                
-                # Show metadata
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.markdown(f"""
-                    <div class="metric-card">
-                        <h3>😊 Sentiment</h3>
-                        <h2>{entry.get('sentiment', 'Unknown').title()}</h2>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    emotions = entry.get('emotions', [])
-                    emotion_text = ', '.join(emotions) if emotions else 'None'
-                    st.markdown(f"""
-                    <div class="metric-card">
-                        <h3>🎭 Emotions</h3>
-                        <h2>{emotion_text}</h2>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col3:
-                    tags = entry.get('tags', [])
-                    tag_text = ', '.join(tags) if tags else 'None'
-                    st.markdown(f"""
-                    <div class="metric-card">
-                        <h3>🏷️ Tags</h3>
-                        <h2>{tag_text}</h2>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                # Show emotions and tags as badges
-                if emotions:
-                    st.markdown("### 🎭 Emotions")
-                    emotion_html = ""
-                    for emotion in emotions:
-                        emotion_html += f'<span class="emotion-badge">{emotion}</span>'
-                    st.markdown(emotion_html, unsafe_allow_html=True)
-                
-                if tags:
-                    st.markdown("### 🏷️ Tags")
-                    tag_html = ""
-                    for tag in tags:
-                        tag_html += f'<span class="tag-badge">{tag}</span>'
-                    st.markdown(tag_html, unsafe_allow_html=True)
-                
+
                 # Delete individual entry option
                 if st.session_state.get('show_delete_selection', False):
                     st.markdown("---")
@@ -2523,81 +2506,105 @@ def view_entries_page():
 def delete_entry_from_files(entry_id, entries_file):
     """Delete a specific entry from all storage files and rebuild FAISS index."""
     try:
-        # Read all entries
-        entries = []
+        # Skip-copy the deleted row instead of parsing and rewriting every line
         if entries_file.exists():
-            with open(entries_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            entry = json.loads(line)
-                            if entry.get('doc_id') != entry_id:
-                                entries.append(entry)
-                        except json.JSONDecodeError:
-                            continue
-        
-        # Rewrite entries file without the deleted entry
-        with open(entries_file, 'w', encoding='utf-8') as f:
-            for entry in entries:
-                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
-        
+            _skip_copy_jsonl(entries_file, entry_id)
+
         # Update FAISS metadata file and rebuild index
         faiss_meta_file = Path("data/faiss_meta.jsonl")
         faiss_index_file = Path("data/faiss_index.faiss")
-        
+        removed_live = False
+
         if faiss_meta_file.exists():
-            faiss_entries = []
-            with open(faiss_meta_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            entry = json.loads(line)
-                            if entry.get('doc_id') != entry_id:
-                                faiss_entries.append(entry)
-                        except json.JSONDecodeError:
-                            continue
-            
-            # Rewrite FAISS metadata
-            with open(faiss_meta_file, 'w', encoding='utf-8') as f:
-                for entry in faiss_entries:
-                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
-            
-            # Rebuild FAISS index from scratch
-            if faiss_entries:
+            _skip_copy_jsonl(faiss_meta_file, entry_id)
+
+            # Prefer mutating the live in-memory index: remove() drops the
+            # vector in place and persists on a background thread, skipping
+            # the write+read round trip of the disk path below
+            store = getattr(st.session_state.get('app'), 'vector_store', None)
+            removed_live = store is not None and store.remove(entry_id)
+
+            if not removed_live and faiss_index_file.exists():
                 import numpy as np
                 import faiss
-                
-                # Extract embeddings
-                embeddings = []
-                for entry in faiss_entries:
-                    if 'embedding' in entry and entry['embedding']:
-                        embeddings.append(entry['embedding'])
-                
-                if embeddings:
-                    vecs = np.array(embeddings).astype('float32')
-                    d = vecs.shape[1]
-                    index = faiss.IndexFlatIP(d)
-                    index.add(vecs)
-                    faiss.write_index(index, str(faiss_index_file))
-            else:
-                # No entries left, remove index file
-                if faiss_index_file.exists():
-                    faiss_index_file.unlink()
+
+                from storage import faiss_id, new_faiss_index
+
+                # ID-mapped indexes can drop just the deleted vector; legacy
+                # flat indexes (positional ids) remove nothing and fall back
+                # to a one-time rebuild below
+                index = faiss.read_index(str(faiss_index_file))
+                try:
+                    removed = index.remove_ids(np.array([faiss_id(entry_id)], dtype='int64'))
+                except RuntimeError:
+                    # HNSW indexes cannot remove vectors in place
+                    removed = 0
+                if removed:
+                    if index.ntotal:
+                        faiss.write_index(index, str(faiss_index_file))
+                    else:
+                        faiss_index_file.unlink()
+                else:
+                    ids, embeddings = [], []
+                    with open(faiss_meta_file, 'rb') as f:
+                        for line in f:
+                            if line.strip():
+                                try:
+                                    entry = _json_loads(line)
+                                except ValueError:
+                                    continue
+                                if entry.get('embedding') and entry.get('doc_id'):
+                                    ids.append(faiss_id(entry['doc_id']))
+                                    embeddings.append(entry['embedding'])
+
+                    if embeddings:
+                        # Fill a pre-allocated float32 matrix row by row so
+                        # the list-of-lists is never copied into a second
+                        # full-size intermediate array
+                        vecs = np.empty((len(embeddings), len(embeddings[0])), dtype=np.float32)
+                        for row, emb in enumerate(embeddings):
+                            vecs[row] = emb
+                        # Embeddings are stored normalized, but re-normalizing
+                        # in place is cheap insurance for the IP metric
+                        faiss.normalize_L2(vecs)
+                        index = faiss.IndexIDMap2(new_faiss_index(vecs.shape[1]))
+                        if not index.is_trained:
+                            index.train(vecs)
+                        index.add_with_ids(vecs, np.array(ids, dtype='int64'))
+                        faiss.write_index(index, str(faiss_index_file))
+                    else:
+                        # No entries left, remove index file
+                        faiss_index_file.unlink()
         
-        # Reload the vector store to refresh the in-memory index
+        # Refresh the in-memory index (already current when removed_live) and
+        # drop caches that may hold the deleted entry
         try:
             if hasattr(st.session_state, 'app') and hasattr(st.session_state.app, 'vector_store'):
-                st.session_state.app.vector_store.reload()
+                if not removed_live:
+                    st.session_state.app.vector_store.reload()
+                st.session_state.app.search_cache.clear()
+                _path_exists.cache_clear()
+                _summary_and_related.clear()
         except Exception as reload_error:
             print(f"Warning: Could not reload vector store: {reload_error}")
-        
+
         return True
-        
+
     except Exception as e:
         raise Exception(f"Failed to delete entry: {e}")
 
+# Escape table for diary text fed to ReportLab's Paragraph markup parser
+_PDF_ESC = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
 def download_pdf_page():
     """Page for downloading diary entries as PDF."""
+    # reportlab is only needed here - import lazily so other pages don't pay
+    # for it on every rerun
+    from reportlab.lib.pagesizes import letter, A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+
     st.markdown("""
     <div class="feature-card">
         <h2>📄 Download PDF</h2>
@@ -2613,19 +2620,17 @@ def download_pdf_page():
             st.info("📝 No entries found to download. Start by adding some diary entries!")
             return
         
-        # Read all entries
-        entries = []
-        with open(entries_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    entries.append(json.loads(line))
-        
+        # Read all entries - one bulk read + split instead of buffered
+        # line-by-line iteration
+        raw = entries_file.read_bytes()
+        entries = [_json_loads(line) for line in raw.split(b'\n') if line.strip()]
+
         if not entries:
             st.info("📝 No entries found to download. Start by adding some diary entries!")
             return
-        
+
         # Sort entries by date
-        entries.sort(key=lambda x: x.get('date', ''))
+        entries.sort(key=itemgetter('date'))
         
         st.markdown(f"""
         <div class="download-section">
@@ -2644,9 +2649,12 @@ def download_pdf_page():
         if st.button("📥 Generate & Download PDF", type="primary", use_container_width=True):
             with st.spinner("🔄 Generating PDF..."):
                 try:
-                    # Create PDF
-                    buffer = io.BytesIO()
-                    doc = SimpleDocTemplate(buffer, pagesize=A4 if page_size == "A4" else letter)
+                    # Create PDF - spool output to disk past 8 MB so large
+                    # exports don't hold the whole document in RAM, and keep
+                    # page-stream compression on explicitly
+                    buffer = tempfile.SpooledTemporaryFile(max_size=1 << 23)
+                    doc = SimpleDocTemplate(buffer, pagesize=A4 if page_size == "A4" else letter,
+                                            pageCompression=1)
                     styles = getSampleStyleSheet()
                     story = []
                     
@@ -2662,31 +2670,35 @@ def download_pdf_page():
                     story.append(Paragraph("MindLens - Digital Diary", title_style))
                     story.append(Paragraph(f"Generated on {datetime.now().strftime('%B %d, %Y')}", styles['Normal']))
                     story.append(Spacer(1, 20))
-                    
+
+                    # Style lookups hoisted out of the loop; entry text is
+                    # escaped so user-written &/< /> can't trip (or abuse)
+                    # ReportLab's markup parser
+                    entry_style = styles['Normal']
+                    heading_style = styles['Heading2']
+
                     # Add entries
                     for i, entry in enumerate(entries, 1):
                         # Entry header
                         date_str = entry.get('date', 'Unknown Date')
-                        story.append(Paragraph(f"Entry {i} - {date_str}", styles['Heading2']))
+                        story.append(Paragraph(f"Entry {i} - {date_str}", heading_style))
                         story.append(Spacer(1, 12))
-                        
+
                         # Entry text
-                        text = entry.get('text', 'No text available')
-                        story.append(Paragraph(text, styles['Normal']))
+                        text = entry.get('text', 'No text available').translate(_PDF_ESC)
+                        story.append(Paragraph(text, entry_style))
                         story.append(Spacer(1, 12))
-                        
+
                         # Metadata if requested
                         if include_metadata:
                             sentiment = entry.get('sentiment', 'Unknown')
                             emotions = ', '.join(entry.get('emotions', [])) or 'None'
                             tags = ', '.join(entry.get('tags', [])) or 'None'
-                            
-                            metadata = f"""
-                            <b>Sentiment:</b> {sentiment.title()}<br/>
-                            <b>Emotions:</b> {emotions}<br/>
-                            <b>Tags:</b> {tags}
-                            """
-                            story.append(Paragraph(metadata, styles['Normal']))
+
+                            metadata = (f"<b>Sentiment:</b> {sentiment.title()}<br/>"
+                                        f"<b>Emotions:</b> {emotions}<br/>"
+                                        f"<b>Tags:</b> {tags}")
+                            story.append(Paragraph(metadata, entry_style))
                         
                         story.append(Spacer(1, 20))
                         
@@ -2698,10 +2710,11 @@ def download_pdf_page():
                     doc.build(story)
                     buffer.seek(0)
                     
-                    # Download button
+                    # Download button streams from the spooled file instead
+                    # of materializing a second bytes copy
                     st.download_button(
                         label="📥 Download PDF",
-                        data=buffer.getvalue(),
+                        data=buffer,
                         file_name=f"mindlens_diary_{datetime.now().strftime('%Y%m%d')}.pdf",
                         mime="application/pdf",
                         use_container_width=True
@@ -2715,6 +2728,15 @@ def download_pdf_page():
     except Exception as e:
         st.error(f"❌ Error loading entries: {e}")
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _nearby_hospitals(place: str) -> list:
+    """Cache the geocode + Overpass lookup per location for an hour."""
+    return mental_health_service.find_nearby_hospitals(place)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _crisis_resources() -> list:
+    return mental_health_service.get_crisis_resources()
+
 def mental_support_page():
     """Page for finding nearby mental health support services."""
     st.markdown("""
@@ -2817,7 +2839,7 @@ def mental_support_page():
         with st.spinner("🔍 Searching for mental health services near you..."):
             try:
                 # Find nearby hospitals
-                hospitals = mental_health_service.find_nearby_hospitals(user_location.strip())
+                hospitals = _nearby_hospitals(user_location.strip())
                 
                 if hospitals:
                     st.markdown("""
@@ -2989,7 +3011,7 @@ def mental_support_page():
     </div>
     """, unsafe_allow_html=True)
     
-    crisis_resources = mental_health_service.get_crisis_resources()
+    crisis_resources = _crisis_resources()
     
     col1, col2 = st.columns(2)
     
@@ -3141,12 +3163,45 @@ def mental_support_page():
                 st.warning("⚠️ Please enter both name and phone number.")
 
 def faq_page():
-    """Page for FAQ.""" 
-    # Import and run the FAQ page
-    import importlib.util
-    spec = importlib.util.spec_from_file_location("faq", "MINDLENS/pages/5_FAQ.py")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    """Page for FAQ."""
+    faq_path = Path("MINDLENS/pages/5_FAQ.py")
+    if not faq_path.exists():
+        st.info("❓ FAQ content is not available in this installation.")
+        return
+    # Cache the imported module in session_state: a module global would be
+    # wiped by Streamlit's per-rerun re-execution of this script
+    module = st.session_state.get('faq_module')
+    if module is None:
+        import importlib.util
+        spec = importlib.util.spec_from_file_location("faq", str(faq_path))
+        module = importlib.util.module_from_spec(spec)
+        # First visit: a module that draws at import time renders here
+        spec.loader.exec_module(module)
+        st.session_state.faq_module = module
+        if not (getattr(module, 'render', None) or getattr(module, 'main', None)):
+            return
+    render = getattr(module, 'render', None) or getattr(module, 'main', None)
+    if render is not None:
+        render()
+    else:
+        # The module draws its widgets at import time, so re-execute it to
+        # render; the cached spec reuses the compiled bytecode
+        module.__spec__.loader.exec_module(module)
+
+# Sidebar navigation table: (button label, page key, renderer).
+# Defined after the page functions so the renderer references resolve.
+NAV_PAGES = [
+    ("📝 Add New Entry", "Add Entry", add_entry_page),
+    ("🔍 Search Entries", "Search Entries", search_entries_page),
+    ("🤖 AI Summary", "AI Summary", ai_summary_page),
+    ("📊 Statistics", "Statistics", statistics_page),
+    ("📚 View All Entries", "View Entries", view_entries_page),
+    ("📄 Download PDF", "Download PDF", download_pdf_page),
+    ("🛡️ Mental Support", "Mental Support", mental_support_page),
+    ("❓ FAQ", "FAQ", faq_page),
+    ("ℹ️ About", "About", about_page),
+]
+PAGE_RENDERERS = {page_key: renderer for _, page_key, renderer in NAV_PAGES}
 
 if __name__ == "__main__":
     main()
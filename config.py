@@ -14,6 +14,14 @@ SUICIDE_TOKENIZER_PATH = os.getenv("SUICIDE_TOKENIZER_PATH", "sucide_detection/t
 # Options: 'chroma' or 'faiss'
 VECTOR_STORE = os.getenv("VECTOR_STORE", "faiss")
 
+# FAISS index type: 'flat' (exact brute-force search), 'hnsw' (graph-based
+# approximate search, sub-linear query time once the diary grows large) or
+# 'sq8' (8-bit scalar quantization, ~4x smaller vectors at near-equal recall)
+FAISS_INDEX_TYPE = os.getenv("FAISS_INDEX_TYPE", "flat").lower()
+FAISS_HNSW_M = int(os.getenv("FAISS_HNSW_M", "32"))
+FAISS_HNSW_EF_CONSTRUCTION = int(os.getenv("FAISS_HNSW_EF_CONSTRUCTION", "80"))
+FAISS_HNSW_EF_SEARCH = int(os.getenv("FAISS_HNSW_EF_SEARCH", "32"))
+
 # Data dirs
 DATA_DIR = Path(os.getenv("DATA_DIR", str(Path.cwd() / "data")))
 CHROMA_DIR = DATA_DIR / "db"
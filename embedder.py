@@ -1,13 +1,41 @@
 
+from functools import lru_cache
 from typing import List
 from pathlib import Path
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
 class SBERTEmbedder:
     def __init__(self, model_dir: str):
         model_dir = str(Path(model_dir))
-        self.model = SentenceTransformer(model_dir)
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.model = SentenceTransformer(model_dir, device=device)
+        # Per-instance LRU so repeated queries (search + AI summary reuse the
+        # same text) cost one transformer forward pass
+        self._encode_one_cached = lru_cache(maxsize=1024)(self._encode_one)
 
     def encode(self, texts: List[str]) -> np.ndarray:
         return self.model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
+
+    def encode_batch(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """Encode many texts in fixed-size batches.
+
+        sentence-transformers length-sorts inputs internally before batching,
+        so padding waste is minimal; bulk callers get one forward pass per
+        batch instead of one per text.
+        """
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+
+    def _encode_one(self, text: str) -> np.ndarray:
+        return self.encode([text])[0]
+
+    def encode_one(self, text: str) -> np.ndarray:
+        """Encode a single text, memoized on the raw string."""
+        return self._encode_one_cached(text)
@@ -12,7 +12,16 @@ class EmotionModel:
         self.tokenizer = AutoTokenizer.from_pretrained(model_dir, local_files_only=True)
         self.model = AutoModelForSequenceClassification.from_pretrained(model_dir, local_files_only=True)
         self.model.eval()
-        
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        if self.device.type == "cuda":
+            # bf16 halves weight/activation bandwidth at negligible accuracy cost
+            self.model = self.model.to(self.device, dtype=torch.bfloat16)
+        else:
+            # Dynamic int8 quantization of the Linear layers: markedly faster
+            # single-sentence inference on CPU, same API
+            self.model = torch.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8)
+
         # Load the actual emotion labels from the pickle file
         labels_file = Path(model_dir) / "labels.pkl"
         if labels_file.exists():
@@ -27,17 +36,45 @@ class EmotionModel:
     @torch.inference_mode()
     def predict(self, text: str, top_k: int = 3, threshold: float = 0.2) -> List[str]:
         inputs = self.tokenizer(text, return_tensors="pt", truncation=True, max_length=256)
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
         outputs = self.model(**inputs)
         logits = outputs.logits.squeeze(0)  # multilabel is common for GoEmotions finetunes
         # If your model is multi-label, apply sigmoid; if single-label, apply softmax
         if self.model.config.problem_type == "multi_label_classification" or logits.ndim == 1:
-            probs = torch.sigmoid(logits).cpu().numpy()
+            # .float() first: numpy has no bfloat16
+            probs = torch.sigmoid(logits).float().cpu().numpy()
             labels = []
             for idx in np.argsort(-probs)[:top_k]:
                 if probs[idx] >= threshold:
                     labels.append(self.id2label.get(idx, str(idx)))
             return labels
         else:
-            probs = torch.softmax(logits, dim=-1).cpu().numpy()
+            probs = torch.softmax(logits, dim=-1).float().cpu().numpy()
             idx = int(np.argmax(probs))
             return [self.id2label.get(idx, str(idx))]
+
+    @torch.inference_mode()
+    def predict_batch(self, texts: List[str], top_k: int = 3, threshold: float = 0.2) -> List[List[str]]:
+        """Predict emotions for many texts in one padded forward pass.
+
+        Bulk callers (ingest/backfill) get one batched GEMM instead of one
+        transformer pass per entry.
+        """
+        if not texts:
+            return []
+        inputs = self.tokenizer(texts, return_tensors="pt", padding=True,
+                                truncation=True, max_length=256)
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        logits = self.model(**inputs).logits
+        # Mirror predict(): it falls through to the sigmoid/top-k branch even
+        # when problem_type is unset (the common case for GoEmotions
+        # finetunes), so only an explicit single-label config takes softmax
+        if self.model.config.problem_type != "single_label_classification":
+            probs = torch.sigmoid(logits).float().cpu().numpy()
+            return [
+                [self.id2label.get(idx, str(idx))
+                 for idx in np.argsort(-row)[:top_k] if row[idx] >= threshold]
+                for row in probs
+            ]
+        probs = torch.softmax(logits, dim=-1).float().cpu().numpy()
+        return [[self.id2label.get(int(idx), str(int(idx)))] for idx in probs.argmax(axis=1)]
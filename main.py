@@ -10,11 +10,15 @@ os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 
 import sys
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import json
 
+import numpy as np
+
 # Add current directory to Python path
 sys.path.append(str(Path(__file__).parent))
 
@@ -35,6 +39,53 @@ from suicide_detector_fallback import SuicideDetectorFallback as SuicideDetector
 from rag import summarize_hits
 from utils import parse_date_str
 
+class SemanticSearchCache:
+    """LRU+TTL cache of search results keyed by query-embedding similarity.
+
+    Queries whose embeddings are nearly identical (cosine >= threshold) to a
+    cached query with the same filters reuse the cached results, skipping the
+    vector search entirely. Embeddings are L2-normalized, so cosine similarity
+    is a plain dot product over the handful of cached vectors.
+    """
+
+    def __init__(self, maxsize: int = 50, ttl: float = 300.0, threshold: float = 0.95):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        # scope -> OrderedDict of cache_id -> (embedding, timestamp, results)
+        self._buckets: Dict[Any, OrderedDict] = {}
+        self._next_id = 0
+
+    def get(self, scope: Any, query_vec: np.ndarray) -> Optional[List[Dict[str, Any]]]:
+        bucket = self._buckets.get(scope)
+        if not bucket:
+            return None
+        now = time.monotonic()
+        best_id, best_sim = None, self.threshold
+        for cache_id, (vec, ts, results) in list(bucket.items()):
+            if now - ts > self.ttl:
+                del bucket[cache_id]
+                continue
+            sim = float(np.dot(vec, query_vec))
+            if sim >= best_sim:
+                best_id, best_sim = cache_id, sim
+        if best_id is None:
+            return None
+        bucket.move_to_end(best_id)
+        return bucket[best_id][2]
+
+    def put(self, scope: Any, query_vec: np.ndarray, results: List[Dict[str, Any]]):
+        bucket = self._buckets.setdefault(scope, OrderedDict())
+        bucket[self._next_id] = (query_vec, time.monotonic(), results)
+        self._next_id += 1
+        while len(bucket) > self.maxsize:
+            bucket.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached results (call whenever entries change)."""
+        self._buckets.clear()
+
+
 class MindLensApp:
     """Main application class for MindLens digital diary."""
     
@@ -54,6 +105,7 @@ class MindLensApp:
         
         print("Initializing vector store...")
         self.vector_store = VectorStore()
+        self.search_cache = SemanticSearchCache()
         
         print("Loading suicide detection model...")
         self.suicide_detector = SuicideDetector(SUICIDE_MODEL_PATH, SUICIDE_TOKENIZER_PATH)
@@ -118,11 +170,18 @@ class MindLensApp:
             tags=tags,
             image_path=image_path,
             image_desc=image_desc,
-            video_path=video_path
+            video_path=video_path,
+            # Persist derived analytics columns at write time
+            sentiment_score={'positive': 1, 'negative': -1}.get(sentiment, 0),
+            text_length=len(text),
+            word_count=len(text.split()),
+            hour=datetime.now().hour
         )
         
         # Store in vector database
         self.vector_store.upsert([record])
+        # Cached search results are stale once a new entry exists
+        self.search_cache.clear()
         
         result = {
             "doc_id": doc_id,
@@ -144,62 +203,90 @@ class MindLensApp:
         print(f"Entry processed and stored. ID: {doc_id}")
         return result
     
-    def search_entries(self, query: str, top_k: int = 5, 
+    def search_entries(self, query: str, top_k: int = 5,
                       filter_emotions: Optional[List[str]] = None,
-                      filter_tags: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+                      filter_tags: Optional[List[str]] = None,
+                      require_image: bool = False,
+                      document_contains: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Search diary entries using semantic similarity.
-        
+
         Args:
             query: Search query
             top_k: Number of results to return
             filter_emotions: Optional list of emotions to filter by
             filter_tags: Optional list of tags to filter by
-            
+            require_image: Only return entries that have an attached image
+            document_contains: Only return entries whose text or image
+                description contains this substring
+
         Returns:
             List of matching diary entries
         """
         print(f"Searching for: '{query}'")
-        
-        # Generate query embedding
-        query_embedding = self.embedder.encode([query])[0].tolist()
-        
+
+        # Generate query embedding (memoized per query string)
+        query_vec = self.embedder.encode_one(query)
+
+        # Near-duplicate queries with the same filters reuse cached results
+        cache_scope = (
+            tuple(sorted(filter_emotions or ())),
+            tuple(sorted(filter_tags or ())),
+            top_k,
+            require_image,
+            document_contains,
+        )
+        cached = self.search_cache.get(cache_scope, query_vec)
+        if cached is not None:
+            print(f"Found {len(cached)} matching entries (cached)")
+            return cached
+
         # Build filter conditions
         where_conditions = {}
         if filter_emotions:
             where_conditions["emotions"] = {"$contains": filter_emotions}
         if filter_tags:
             where_conditions["tags"] = {"$contains": filter_tags}
-        
+        if require_image:
+            where_conditions["has_image"] = True
+        if document_contains:
+            where_conditions["document_contains"] = document_contains
+
         # Search vector store
         hits = self.vector_store.query(
-            query_vec=query_embedding,
+            query_vec=query_vec.tolist(),
             top_k=top_k,
             where=where_conditions if where_conditions else None
         )
-        
+        self.search_cache.put(cache_scope, query_vec, hits)
+
         print(f"Found {len(hits)} matching entries")
         return hits
     
-    def get_ai_summary(self, query: str, top_k: int = 5) -> str:
+    def get_ai_summary(self, query: str, top_k: int = 5, return_context: bool = False):
         """
         Get AI-powered summary of search results.
-        
+
         Args:
             query: Search query
             top_k: Number of entries to include in summary
-            
+            return_context: Also return the retrieved entries the summary was
+                built from, saving callers a second search
+
         Returns:
-            AI-generated summary
+            AI-generated summary, or (summary, hits) if return_context is True
         """
         hits = self.search_entries(query, top_k)
         if not hits:
-            return "No matching entries found."
-        
-        if LLM_BACKEND == "none":
-            return self._format_simple_summary(query, hits)
-        
-        return summarize_hits(query, hits)
+            summary = "No matching entries found."
+        elif LLM_BACKEND == "none":
+            summary = self._format_simple_summary(query, hits)
+        else:
+            summary = summarize_hits(query, hits)
+
+        if return_context:
+            return summary, hits
+        return summary
     
     def _format_simple_summary(self, query: str, hits: List[Dict[str, Any]]) -> str:
         """Format a simple summary without LLM."""
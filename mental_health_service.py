@@ -6,6 +6,35 @@ Mental Health Support Service using OpenStreetMap (No API Key Required)
 import requests
 from typing import List, Dict
 
+# Parsed contact files keyed by path. Storing the file's mtime lets callers
+# validate the cache with a single stat() instead of re-opening and re-parsing
+# the JSON on every call.
+_contacts_cache: Dict[str, tuple] = {}
+
+
+def _read_contacts(path: str) -> list:
+    """Read a contacts JSON file, reusing the parsed result until it changes on disk."""
+    import json
+    import os
+
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return []
+
+    cached = _contacts_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, 'r') as f:
+        contacts = json.load(f)
+    if not isinstance(contacts, list):
+        contacts = []
+
+    _contacts_cache[path] = (mtime, contacts)
+    return contacts
+
+
 class MentalHealthService:
     """Service to find nearby mental health hospitals using OpenStreetMap."""
     
@@ -229,20 +258,11 @@ class MentalHealthService:
             List of emergency contacts
         """
         try:
-            import json
-            import os
             from config import EMERGENCY_CONTACTS_JSON
-            
-            # Check if contacts file exists
-            if not os.path.exists(EMERGENCY_CONTACTS_JSON):
-                return []
-            
-            # Load emergency contacts
-            with open(EMERGENCY_CONTACTS_JSON, 'r') as f:
-                contacts = json.load(f)
-            
-            return contacts if isinstance(contacts, list) else []
-            
+
+            # mtime-validated cache: one stat() per call instead of open+parse
+            return _read_contacts(EMERGENCY_CONTACTS_JSON)
+
         except Exception as e:
             print(f"❌ Error loading emergency contacts: {e}")
             return []
@@ -1,13 +1,18 @@
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
+import threading
 from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 import uuid
 import json
 import numpy as np
 
-from config import VECTOR_STORE, CHROMA_DIR, FAISS_INDEX_PATH, FAISS_META_JSONL, ENTRIES_JSONL
+from config import (
+    VECTOR_STORE, CHROMA_DIR, FAISS_INDEX_PATH, FAISS_META_JSONL, ENTRIES_JSONL,
+    FAISS_INDEX_TYPE, FAISS_HNSW_M, FAISS_HNSW_EF_CONSTRUCTION, FAISS_HNSW_EF_SEARCH,
+)
 
 # Optional deps
 try:
@@ -21,6 +26,10 @@ try:
 except Exception:
     faiss = None
 
+# Minimum vectors before an sq8 index is worth training: per-dimension value
+# ranges fitted on fewer samples than this produce a saturated codebook
+SQ8_MIN_TRAIN_VECTORS = 64
+
 @dataclass
 class DiaryRecord:
     doc_id: str
@@ -35,10 +44,19 @@ class DiaryRecord:
     image_desc: Optional[str] = None  # user-provided description for retrieval
     # Optional video metadata
     video_path: Optional[str] = None  # relative path to stored video
+    # Derived columns persisted at write time so the analytics dashboard does
+    # not recompute them over the full history on every build
+    sentiment_score: Optional[int] = None  # -1/0/1 from sentiment
+    text_length: Optional[int] = None
+    word_count: Optional[int] = None
+    hour: Optional[int] = None  # local hour the entry was written
 
 class VectorStore:
     def __init__(self):
         self.backend = VECTOR_STORE.lower()
+        # Serializes index mutation and persistence: the background writer
+        # must never serialize the index while another thread is mutating it
+        self._index_lock = threading.Lock()
         if self.backend == "chroma":
             if chromadb is None:
                 raise RuntimeError("chromadb package not installed.")
@@ -57,11 +75,86 @@ class VectorStore:
             if FAISS_META_JSONL.exists():
                 with open(FAISS_META_JSONL, "r", encoding="utf-8") as f:
                     self.metadata = [DiaryRecord(**json.loads(line)) for line in f]
+            self._rebuild_quantized_if_ready()
         else:
             raise ValueError("Unsupported VECTOR_STORE: use 'chroma' or 'faiss'")
 
         ENTRIES_JSONL.parent.mkdir(parents=True, exist_ok=True)
 
+    # Single worker: index writes for one store must not interleave
+    _index_writer = ThreadPoolExecutor(max_workers=1)
+
+    def _write_index(self):
+        """Persist the live index under the lock (safe from any thread)."""
+        with self._index_lock:
+            faiss.write_index(self.index, str(FAISS_INDEX_PATH))
+
+    def _new_trained_base(self, vecs: np.ndarray):
+        """Base index for the first add, trained on representative data.
+
+        sq8 fits per-dimension value ranges at train time, and fitting them
+        on a near-empty first batch saturates the codebook. Train on the
+        embeddings already persisted in the metadata JSONL plus the incoming
+        batch; below SQ8_MIN_TRAIN_VECTORS total, start with an exact flat
+        index instead — the next load past the threshold upgrades it (see
+        _rebuild_quantized_if_ready).
+        """
+        if FAISS_INDEX_TYPE == "sq8":
+            stored = [r.embedding for r in self.metadata if r.embedding]
+            if len(stored) + len(vecs) < SQ8_MIN_TRAIN_VECTORS:
+                return faiss.IndexFlatIP(vecs.shape[1])
+            train = np.vstack([np.array(stored, dtype="float32"), vecs]) if stored else vecs
+            base = new_faiss_index(vecs.shape[1])
+            base.train(train)
+            return base
+        return new_faiss_index(vecs.shape[1])
+
+    def _rebuild_quantized_if_ready(self):
+        """Upgrade the loaded index to sq8 once enough vectors exist.
+
+        Covers both the deferred case above and flipping FAISS_INDEX_TYPE to
+        'sq8' on an existing diary: if the on-disk index is not quantized but
+        the metadata holds a trainable sample, rebuild and persist it.
+        """
+        if FAISS_INDEX_TYPE != "sq8" or self.index is None:
+            return
+        if len(self.metadata) < SQ8_MIN_TRAIN_VECTORS:
+            return
+        inner = faiss.downcast_index(self.index)
+        if isinstance(inner, faiss.IndexIDMap2):
+            inner = faiss.downcast_index(inner.index)
+        if isinstance(inner, faiss.IndexScalarQuantizer):
+            return
+        vecs = np.array([r.embedding for r in self.metadata], dtype="float32")
+        ids = np.array([faiss_id(r.doc_id) for r in self.metadata], dtype="int64")
+        base = new_faiss_index(vecs.shape[1])
+        base.train(vecs)
+        index = faiss.IndexIDMap2(base)
+        index.add_with_ids(vecs, ids)
+        self.index = index
+        faiss.write_index(self.index, str(FAISS_INDEX_PATH))
+
+    def remove(self, doc_id: str) -> bool:
+        """Drop one record from the live FAISS index without a disk round trip.
+
+        Mutates the in-memory index and metadata, then persists the index on
+        a background thread. Returns False when in-place removal isn't
+        possible (chroma backend, no index, legacy or HNSW index) so callers
+        can fall back to a rebuild.
+        """
+        if self.backend != "faiss" or self.index is None:
+            return False
+        with self._index_lock:
+            try:
+                removed = self.index.remove_ids(np.array([faiss_id(doc_id)], dtype="int64"))
+            except RuntimeError:
+                return False
+            if not removed:
+                return False
+            self.metadata = [r for r in self.metadata if r.doc_id != doc_id]
+        self._index_writer.submit(self._write_index)
+        return True
+
     def reload(self):
         """Reload the vector store from disk (useful after external modifications)."""
         if self.backend == "chroma":
@@ -69,13 +162,14 @@ class VectorStore:
             pass
         elif self.backend == "faiss":
             # Reload FAISS index and metadata from disk
-            self.index = None
-            self.metadata = []
-            if FAISS_INDEX_PATH.exists():
-                self.index = faiss.read_index(str(FAISS_INDEX_PATH))
-            if FAISS_META_JSONL.exists():
-                with open(FAISS_META_JSONL, "r", encoding="utf-8") as f:
-                    self.metadata = [DiaryRecord(**json.loads(line)) for line in f]
+            with self._index_lock:
+                self.index = None
+                self.metadata = []
+                if FAISS_INDEX_PATH.exists():
+                    self.index = faiss.read_index(str(FAISS_INDEX_PATH))
+                if FAISS_META_JSONL.exists():
+                    with open(FAISS_META_JSONL, "r", encoding="utf-8") as f:
+                        self.metadata = [DiaryRecord(**json.loads(line)) for line in f]
 
     def upsert(self, records: List[DiaryRecord]):
         if self.backend == "chroma":
@@ -90,32 +184,54 @@ class VectorStore:
                 "image_path": r.image_path,
                 "image_desc": r.image_desc,
                 "video_path": r.video_path,
+                # Explicit bool for the has_image filter: chroma where
+                # clauses can't compare against None
+                "has_image": bool(r.image_path),
             } for r in records]
             self.col.upsert(ids=ids, embeddings=embs, metadatas=metas, documents=[r.text for r in records])
         else:
             # FAISS
             import numpy as np
             vecs = np.array([r.embedding for r in records]).astype("float32")
-            if self.index is None:
-                d = vecs.shape[1]
-                self.index = faiss.IndexFlatIP(d)
-            self.index.add(vecs)
+            ids = np.array([faiss_id(r.doc_id) for r in records], dtype="int64")
+            with self._index_lock:
+                if self.index is None:
+                    # ID-mapped index so single entries can be removed in place
+                    # instead of rebuilding the whole index on delete
+                    self.index = faiss.IndexIDMap2(self._new_trained_base(vecs))
+                try:
+                    self.index.add_with_ids(vecs, ids)
+                except RuntimeError:
+                    # Legacy flat index loaded from disk: ids are positional
+                    self.index.add(vecs)
             # append metadata
             with open(FAISS_META_JSONL, "a", encoding="utf-8") as f:
                 for r in records:
                     f.write(json.dumps(asdict(r), ensure_ascii=False) + "\n")
-            faiss.write_index(self.index, str(FAISS_INDEX_PATH))
+            self._write_index()
 
         # append to entries jsonl for analytics
         with open(ENTRIES_JSONL, "a", encoding="utf-8") as f:
             for r in records:
-                f.write(json.dumps(asdict(r), ensure_ascii=False) + "\n")
+                rec = asdict(r)
+                # The embedding already lives in the vector store (and in
+                # faiss_meta for rebuilds); persisting it here only bloats
+                # the file every dashboard build and page load has to parse
+                rec.pop("embedding", None)
+                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
 
     def query(self, query_vec: List[float], top_k: int = 5,
               where: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        where = where or {}
+        where = dict(where) if where else {}
+        # Store-level filters so callers get top_k results back already
+        # filtered instead of post-filtering in Python
+        require_image = where.pop("has_image", False)
+        document_contains = where.pop("document_contains", None)
         if self.backend == "chroma":
-            res = self.col.query(query_embeddings=[query_vec], n_results=top_k, where=where, include=["metadatas", "documents", "distances", "ids"])
+            if require_image:
+                where["has_image"] = True
+            where_document = {"$contains": document_contains} if document_contains else None
+            res = self.col.query(query_embeddings=[query_vec], n_results=top_k, where=where or None, where_document=where_document, include=["metadatas", "documents", "distances", "ids"])
             # normalize output
             out = []
             for i in range(len(res["ids"][0])):
@@ -141,10 +257,18 @@ class VectorStore:
                 with open(FAISS_META_JSONL, "r", encoding="utf-8") as f:
                     for line in f:
                         metas.append(json.loads(line))
+            # ID-mapped indexes return the stable per-doc id; legacy flat
+            # indexes return row positions, so fall back to those
+            by_id = {faiss_id(m["doc_id"]): m for m in metas if m.get("doc_id")}
             for dist, idx in zip(distances[0], idxs[0]):
                 if idx == -1:
                     continue
-                meta = metas[idx]
+                idx = int(idx)
+                meta = by_id.get(idx)
+                if meta is None:
+                    if idx >= len(metas):
+                        continue
+                    meta = metas[idx]
                 # apply where filters (tags/emotions intersection checks)
                 ok = True
                 if "tags" in where:
@@ -167,6 +291,13 @@ class VectorStore:
                     meta_emotions = set(meta.get("emotions", []))
                     if not needed.intersection(meta_emotions):  # Check if any emotion matches
                         ok = False
+                if ok and require_image and not meta.get("image_path"):
+                    ok = False
+                if ok and document_contains:
+                    needle = document_contains.lower()
+                    if (needle not in (meta.get("image_desc") or "").lower()
+                            and needle not in (meta.get("text") or "").lower()):
+                        ok = False
                 if ok:
                     matches.append({**meta, "distance": float(dist)})
                 if len(matches) >= top_k:
@@ -175,3 +306,28 @@ class VectorStore:
 
 def new_doc_id() -> str:
     return str(uuid.uuid4())
+
+def faiss_id(doc_id: str) -> int:
+    """Stable non-negative int64 for a doc_id, used as its FAISS vector id."""
+    return uuid.UUID(doc_id).int & 0x7FFFFFFFFFFFFFFF
+
+def new_faiss_index(d: int):
+    """Create the configured base FAISS index for d-dimensional embeddings.
+
+    'flat' scans every vector exactly; 'hnsw' searches a proximity graph in
+    sub-linear time at near-identical recall for diary-scale corpora (note:
+    HNSW cannot remove vectors, so deletes fall back to a rebuild).
+    """
+    if FAISS_INDEX_TYPE == "hnsw":
+        index = faiss.IndexHNSWFlat(d, FAISS_HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = FAISS_HNSW_EF_CONSTRUCTION
+        index.hnsw.efSearch = FAISS_HNSW_EF_SEARCH
+        return index
+    if FAISS_INDEX_TYPE == "sq8":
+        # Stores 1 byte per dimension instead of 4. Returned untrained:
+        # callers must train the per-dimension ranges on a representative
+        # sample (at least SQ8_MIN_TRAIN_VECTORS) before adding — see
+        # VectorStore._new_trained_base / _rebuild_quantized_if_ready
+        return faiss.IndexScalarQuantizer(d, faiss.ScalarQuantizer.QT_8bit,
+                                          faiss.METRIC_INNER_PRODUCT)
+    return faiss.IndexFlatIP(d)